@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Measure batch query throughput (patterns per second)
+
+Each batch mimics one OCR frame: a base reading plus variants with one letter
+revealed or misread. Compares calling filter_words in a loop with filter_many.
+
+    python benchmarks/bench_batch_queries.py
+    python benchmarks/bench_batch_queries.py --sizes bundled,200000 --batches 50
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import time
+
+from bench_matching import bundled_words, make_bank_folder, sample_patterns, synthetic_words
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.word_filtering import WordFilter  # noqa: E402
+
+
+def make_batches(words, count, size, rng):
+    """Build batches of related patterns around a base reading"""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    batches = []
+    for base in sample_patterns(words, count, rng):
+        batch = [base]
+        while len(batch) < size:
+            chars = list(base)
+            position = rng.randrange(len(chars))
+            chars[position] = rng.choice(letters)
+            if rng.random() < 0.3:
+                chars.append(rng.choice(letters))
+            batch.append("".join(chars))
+        batches.append(batch)
+    return batches
+
+
+def throughput(func, batches):
+    """Run func over every batch; return patterns per second"""
+    start = time.perf_counter()
+    for batch in batches:
+        func(batch)
+    elapsed = time.perf_counter() - start
+    return sum(len(batch) for batch in batches) / elapsed if elapsed else float("inf")
+
+
+def run_bank(name, words, args, rng):
+    """Benchmark loop vs batch evaluation on one word bank"""
+    root, folder = make_bank_folder(words)
+    try:
+        word_filter = WordFilter(wordlists_folder=folder)
+        word_filter.update_selected_wordlists(["bank.txt"])
+        batches = make_batches(word_filter.word_list, args.batches, args.batch_size, rng)
+        print(f"\n== {name}: {word_filter.get_word_count()} words, "
+              f"{args.batches} batches of {args.batch_size} patterns")
+        print(f"{'engine':<8} {'exact':<6} {'loop p/s':>12} {'batch p/s':>12} {'counts p/s':>12}")
+
+        for engine in ("index", "numpy"):
+            word_filter.set_engine(engine)
+            if word_filter.engine != engine:
+                continue
+            for exact in (False, True):
+                loop = throughput(lambda batch: [word_filter.filter_words(p, exact) for p in batch], batches)
+                batch = throughput(lambda batch: word_filter.filter_many(batch, exact), batches)
+                counts = throughput(lambda batch: word_filter.filter_many(batch, exact, counts_only=True), batches)
+                print(f"{engine:<8} {str(exact):<6} {loop:>12.0f} {batch:>12.0f} {counts:>12.0f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="bundled,1000000",
+                        help="comma-separated banks: 'bundled' and/or synthetic word counts")
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    seed_words = bundled_words()
+    for size in args.sizes.split(","):
+        size = size.strip()
+        if size == "bundled":
+            run_bank("bundled", seed_words, args, rng)
+        else:
+            count = int(size)
+            run_bank(f"synthetic {count}", synthetic_words(count, seed_words, rng), args, rng)
+
+
+if __name__ == "__main__":
+    main()
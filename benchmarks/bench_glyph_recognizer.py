@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Measure glyph recognizer latency on synthetic hint lines
+
+Hints are rendered in a synthetic bitmap font: each character gets a fixed
+random bitmap, and underscores are bottom bars. The fallback reader looks
+glyphs up in that font and counts its calls, standing in for Tesseract. It
+shows how quickly the template cache warms up and what a warm read costs.
+
+    python benchmarks/bench_glyph_recognizer.py
+    python benchmarks/bench_glyph_recognizer.py --hints 2000 --width 600
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.capture.glyph_recognizer import GlyphRecognizer  # noqa: E402
+from bench_matching import bundled_words  # noqa: E402
+
+GLYPH_HEIGHT, GLYPH_WIDTH, GAP, SPACE = 16, 10, 3, 14
+
+
+def make_font(rng):
+    """Random but fixed bitmaps for every letter and digit; rows 0 and 15 stay blank for bars"""
+    font = {}
+    for char in "abcdefghijklmnopqrstuvwxyz0123456789":
+        bitmap = rng.random((GLYPH_HEIGHT - 4, GLYPH_WIDTH)) < 0.45
+        bitmap[:, 0] = bitmap[:, -1] = True  # solid sides keep the glyph one connected slot
+        glyph = np.zeros((GLYPH_HEIGHT, GLYPH_WIDTH), dtype=bool)
+        glyph[1:GLYPH_HEIGHT - 3] = bitmap
+        font[char] = glyph
+    bar = np.zeros((GLYPH_HEIGHT, GLYPH_WIDTH), dtype=bool)
+    bar[-2:] = True
+    font['_'] = bar
+    return font
+
+
+def render(hint, font, width):
+    """Draw a hint as dark glyphs on a light grayscale line"""
+    line = np.full((GLYPH_HEIGHT + 8, width), 235, dtype=np.uint8)
+    x = 6
+    for char in hint:
+        if char == ' ':
+            x += SPACE
+            continue
+        line[4:4 + GLYPH_HEIGHT, x:x + GLYPH_WIDTH][font[char]] = 20
+        x += GLYPH_WIDTH + GAP
+    return line
+
+
+def make_hints(words, count, rng):
+    """Hints as they appear mid-round: some letters revealed, the rest underscores"""
+    hints = []
+    for _ in range(count):
+        word = rng.choice(words)
+        hints.append(''.join(c if c == ' ' or rng.random() < 0.3 else '_' for c in word))
+    return hints
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hints", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=600, help="line width in pixels")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    font = make_font(np.random.default_rng(args.seed))
+    max_chars = args.width // (GLYPH_WIDTH + GAP) - 2
+    words = [w.lower() for w in bundled_words() if set(w.lower()) <= set(font) | {' '} and len(w) <= max_chars]
+    hints = make_hints(words, args.hints, rng)
+    lines = [render(hint, font, args.width) for hint in hints]
+
+    lookup = {glyph.tobytes(): char for char, glyph in font.items()}
+    fallback_calls = []
+
+    def fallback(glyph):
+        fallback_calls.append(1)
+        padded = np.zeros((GLYPH_HEIGHT, GLYPH_WIDTH), dtype=bool)
+        padded[-glyph.shape[0]:, :glyph.shape[1]] = glyph[:GLYPH_HEIGHT, :GLYPH_WIDTH]
+        return lookup.get(padded.tobytes(), '?')
+
+    recognizer = GlyphRecognizer(fallback)
+    timings = []
+    correct = 0
+    for hint, line in zip(hints, lines):
+        start = time.perf_counter()
+        text = recognizer.read_gray(line)
+        timings.append((time.perf_counter() - start) * 1000)
+        correct += text == hint
+
+    half = timings[len(timings) // 2:]
+    half.sort()
+    print(f"{len(hints)} hints, {correct} read correctly, {len(fallback_calls)} fallback calls, "
+          f"{len(recognizer.templates)} templates")
+    print(f"first read {timings[0]:.3f} ms, warm mean {sum(half) / len(half):.3f} ms, "
+          f"warm p95 {half[int(len(half) * 0.95) - 1]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
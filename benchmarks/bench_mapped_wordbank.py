@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compare startup cost and query latency of the memory-mapped wordbank with the
+in-memory index engine
+
+Each engine runs in its own child process. RSS is reported right after
+startup and again after the queries (the mapped pages touched by the queries
+are counted once the OS maps them in).
+
+    python benchmarks/bench_mapped_wordbank.py
+    python benchmarks/bench_mapped_wordbank.py --sizes bundled,1000000,5000000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+from bench_matching import bundled_words, make_bank_folder, sample_patterns, synthetic_words
+from bench_sqlite_engine import rss_mb
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.word_filtering import WordFilter  # noqa: E402
+from pictor.utils.mapped_wordbank import write_mapped_wordbank  # noqa: E402
+
+
+def run_child(args):
+    """Start one engine, answer the patterns and print the measurements as JSON"""
+    with open(args.patterns, encoding="utf-8") as f:
+        patterns = json.load(f)
+
+    start = time.perf_counter()
+    if args.child == "index":
+        word_filter = WordFilter(wordlists_folder=args.folder)
+        word_filter.update_selected_wordlists(["bank.txt"])
+    else:
+        word_filter = WordFilter(wordlists_folder=args.folder, mapped_wordbank=args.bank)
+    startup_ms = (time.perf_counter() - start) * 1000
+    startup_rss = rss_mb()
+
+    timings = []
+    for pattern in patterns:
+        start = time.perf_counter()
+        word_filter.filter_words(pattern, args.exact)
+        timings.append((time.perf_counter() - start) * 1000)
+    cold_ms = timings[0]
+    timings = sorted(timings[1:])
+    print(json.dumps({
+        "startup_ms": startup_ms,
+        "startup_rss_mb": startup_rss,
+        "cold_ms": cold_ms,
+        "warm_mean_ms": sum(timings) / len(timings),
+        "warm_p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "rss_mb": rss_mb(),
+    }))
+
+
+def measure(engine, folder, bank, patterns_file, exact):
+    """Run one engine in a child process"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", engine, "--folder", folder,
+               "--bank", bank, "--patterns", patterns_file]
+    if exact:
+        command.append("--exact")
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def format_mb(value):
+    return f"{value:.1f}" if value is not None else "n/a"
+
+
+def run_bank(name, words, args, rng):
+    """Benchmark both engines on one word bank"""
+    root, folder = make_bank_folder(words)
+    try:
+        bank = os.path.join(root, "bank.pwb")
+        start = time.perf_counter()
+        write_mapped_wordbank(bank, words)
+        write_ms = (time.perf_counter() - start) * 1000
+
+        patterns_file = os.path.join(root, "patterns.json")
+        with open(patterns_file, "w", encoding="utf-8") as f:
+            json.dump(sample_patterns(words, args.queries, rng), f)
+
+        print(f"\n== {name}: {len(words)} words, {args.queries} patterns "
+              f"(mapped file written in {write_ms:.0f} ms, {os.path.getsize(bank) / 2 ** 20:.1f} MB)")
+        print(f"{'engine':<8} {'exact':<6} {'start ms':>10} {'start MB':>9} {'cold ms':>9} "
+              f"{'warm ms':>9} {'p95 ms':>9} {'end MB':>8}")
+        for engine in ("index", "mapped"):
+            for exact in (False, True):
+                result = measure(engine, folder, bank, patterns_file, exact)
+                print(f"{engine:<8} {str(exact):<6} {result['startup_ms']:>10.1f} "
+                      f"{format_mb(result['startup_rss_mb']):>9} {result['cold_ms']:>9.3f} "
+                      f"{result['warm_mean_ms']:>9.3f} {result['warm_p95_ms']:>9.3f} {format_mb(result['rss_mb']):>8}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="bundled,1000000",
+                        help="comma-separated banks: 'bundled' and/or synthetic word counts")
+    parser.add_argument("--queries", type=int, default=100, help="patterns per bank")
+    parser.add_argument("--seed", type=int, default=0)
+    # Internal: run a single engine (used for the child processes)
+    parser.add_argument("--child", choices=("index", "mapped"), help=argparse.SUPPRESS)
+    parser.add_argument("--folder", help=argparse.SUPPRESS)
+    parser.add_argument("--bank", help=argparse.SUPPRESS)
+    parser.add_argument("--patterns", help=argparse.SUPPRESS)
+    parser.add_argument("--exact", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    rng = random.Random(args.seed)
+    seed_words = bundled_words()
+    for size in args.sizes.split(","):
+        size = size.strip()
+        if size == "bundled":
+            run_bank("bundled", seed_words, args, rng)
+        else:
+            count = int(size)
+            run_bank(f"synthetic {count}", synthetic_words(count, seed_words, rng), args, rng)
+
+
+if __name__ == "__main__":
+    main()
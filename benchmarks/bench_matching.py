@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark pattern matching engines on the bundled wordlists and synthetic banks
+
+Compares the original per-word regex scan, the indexed WordFilter engine and
+the NumPy character-matrix engine.
+
+    python benchmarks/bench_matching.py
+    python benchmarks/bench_matching.py --sizes bundled,1000000 --queries 200
+"""
+import argparse
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.word_filtering import WordFilter  # noqa: E402
+
+
+def make_bank_folder(words):
+    """Write words into a temporary wordlists folder WordFilter can load"""
+    root = tempfile.mkdtemp(prefix="pictor_bench_")
+    folder = os.path.join(root, "wordlists")
+    os.makedirs(folder)
+    with open(os.path.join(folder, "bank.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(words))
+    with open(os.path.join(folder, "user_added_words.txt"), "w", encoding="utf-8") as f:
+        f.write("")
+    return root, folder
+
+
+def bundled_words():
+    """Get every word from the bundled wordlists"""
+    folder = os.path.join(project_root, "pictor", "wordlists")
+    words = []
+    for filename in sorted(os.listdir(folder)):
+        if filename.endswith(".txt"):
+            with open(os.path.join(folder, filename), encoding="utf-8") as f:
+                words.extend(line.strip() for line in f if line.strip())
+    return words
+
+
+def synthetic_words(count, seed_words, rng):
+    """Generate words following the letter and length distribution of seed_words"""
+    letters = "".join(seed_words).lower().replace(" ", "")
+    lengths = [len(word) for word in seed_words]
+    return ["".join(rng.choices(letters, k=rng.choice(lengths))) for _ in range(count)]
+
+
+def sample_patterns(words, count, rng):
+    """Build hint-like patterns: a random prefix of a real word with some letters hidden"""
+    patterns = []
+    for _ in range(count):
+        word = rng.choice(words).lower()
+        size = rng.randint(max(1, len(word) // 2), len(word))
+        reveal = rng.random()
+        patterns.append("".join(c if c == " " or rng.random() < reveal else "_" for c in word[:size]))
+    return patterns
+
+
+def regex_scan(word_list, pattern, exact_length):
+    """The original filter_words: one regex over every word"""
+    body = "".join("." if c == "_" else re.escape(c) for c in pattern)
+    regex = re.compile(f"^{body}$" if exact_length else f"^{body}.*$", re.IGNORECASE)
+    return [word for word in word_list if regex.match(word)]
+
+
+def time_queries(func, patterns):
+    """Run func over every pattern; return (mean ms, p95 ms, total matches)"""
+    timings = []
+    total = 0
+    for pattern in patterns:
+        start = time.perf_counter()
+        total += len(func(pattern))
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return sum(timings) / len(timings), timings[int(len(timings) * 0.95) - 1], total
+
+
+def run_bank(name, words, args, rng):
+    """Benchmark every engine on one word bank"""
+    root, folder = make_bank_folder(words)
+    try:
+        start = time.perf_counter()
+        word_filter = WordFilter(wordlists_folder=folder)
+        word_filter.update_selected_wordlists(["bank.txt"])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        patterns = sample_patterns(word_filter.word_list, args.queries, rng)
+        print(f"\n== {name}: {word_filter.get_word_count()} words, {len(patterns)} patterns "
+              f"(index build {build_ms:.0f} ms)")
+
+        engines = [("regex", None), ("index", "index")]
+        word_filter.set_engine("numpy")
+        if word_filter.engine == "numpy":
+            start = time.perf_counter()
+            word_filter._get_char_matrix()
+            print(f"(numpy matrices packed in {(time.perf_counter() - start) * 1000:.0f} ms)")
+            engines.append(("numpy", "numpy"))
+        else:
+            print("(numpy not installed, skipping numpy engine)")
+
+        print(f"{'engine':<10} {'exact':<6} {'mean ms':>10} {'p95 ms':>10} {'matches':>10}")
+
+        for engine_name, engine in engines:
+            if engine:
+                word_filter.set_engine(engine)
+            for exact in (False, True):
+                if engine:
+                    func = lambda p: word_filter.filter_words(p, exact)  # noqa: E731
+                else:
+                    func = lambda p: regex_scan(word_filter.word_list, p, exact)  # noqa: E731
+                mean, p95, total = time_queries(func, patterns)
+                print(f"{engine_name:<10} {str(exact):<6} {mean:>10.3f} {p95:>10.3f} {total:>10}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="bundled,1000000,5000000",
+                        help="comma-separated banks: 'bundled' and/or synthetic word counts")
+    parser.add_argument("--queries", type=int, default=100, help="patterns per bank")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    seed_words = bundled_words()
+    for size in args.sizes.split(","):
+        size = size.strip()
+        if size == "bundled":
+            run_bank("bundled", seed_words, args, rng)
+        else:
+            count = int(size)
+            run_bank(f"synthetic {count}", synthetic_words(count, seed_words, rng), args, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Measure OCR stage throughput and per-frame latency
+
+Feeds synthetic hint frames at a fixed rate through OCRPool and reports
+frames read per second, p95 latency and stale (dropped) frames. With
+--backend tesseract, a direct in-process loop (one backend call per frame,
+as pytesseract is normally used) is measured first for comparison.
+
+    python benchmarks/bench_ocr_pool.py
+    python benchmarks/bench_ocr_pool.py --backend tesseract --workers 1,2,4 --fps 10
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.capture.capture_engine import Frame, FrameRing  # noqa: E402
+from pictor.capture.ocr_pool import OCR_BACKENDS, OCRPool  # noqa: E402
+
+
+def synthetic_frame(sequence, width=400, height=40):
+    """A white BGRA frame with a few dark glyph-sized blocks"""
+    data = bytearray(b'\xff' * (width * height * 4))
+    for slot in range(sequence % 5 + 3):
+        for y in range(10, 30):
+            start = ((y * width) + 20 + slot * 30) * 4
+            data[start:start + 16 * 4] = b'\x00\x00\x00\xff' * 16
+    return Frame(sequence, time.perf_counter(), width, height, data)
+
+
+def direct_loop(backend_name, options, frames):
+    """Call the backend in this process once per frame; return (frames/s, p95 ms)"""
+    backend = OCR_BACKENDS[backend_name](**options)
+    timings = []
+    start = time.perf_counter()
+    for frame in frames:
+        began = time.perf_counter()
+        backend.read(frame)
+        timings.append((time.perf_counter() - began) * 1000)
+    elapsed = time.perf_counter() - start
+    timings.sort()
+    return len(frames) / elapsed, timings[max(0, int(len(timings) * 0.95) - 1)]
+
+
+def pool_run(backend_name, options, workers, fps, duration):
+    """Push frames at fps into a pool for duration seconds; return its stats"""
+    ring = FrameRing()
+    pool = OCRPool(backend_name, workers, backend_options=options)
+    pool.start(ring)
+    try:
+        # Let the workers finish starting before timing
+        time.sleep(1.0)
+        period = 1.0 / fps
+        deadline = time.perf_counter()
+        end = deadline + duration
+        sequence = 0
+        while deadline < end:
+            sequence += 1
+            ring.push(synthetic_frame(sequence))
+            deadline += period
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+        time.sleep(0.5)
+        return pool.stats(), sequence
+    finally:
+        pool.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=sorted(OCR_BACKENDS), default="stub")
+    parser.add_argument("--stub-delay", type=float, default=0.05, help="seconds per stub read")
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated pool sizes")
+    parser.add_argument("--fps", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per pool run")
+    args = parser.parse_args()
+
+    options = {"text": "h_ll_", "delay": args.stub_delay} if args.backend == "stub" else {}
+    if args.backend == "tesseract":
+        frames = [synthetic_frame(i) for i in range(20)]
+        rate, p95 = direct_loop(args.backend, options, frames)
+        print(f"direct calls: {rate:.1f} frames/s, p95 {p95:.1f} ms")
+
+    print(f"{'workers':>8} {'fed':>6} {'read':>6} {'stale':>6} {'frames/s':>10} {'p95 ms':>8}")
+    for workers in args.workers.split(","):
+        stats, fed = pool_run(args.backend, options, int(workers), args.fps, args.duration)
+        if stats['error']:
+            print(f"{workers:>8} error: {stats['error']}")
+            continue
+        print(f"{workers:>8} {fed:>6} {stats['read']:>6} {stats['stale']:>6} "
+              f"{stats['throughput']:>10.1f} {stats['p95_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Measure per-frame preprocessing cost at common hint-region sizes
+
+Compares the reused-buffer FramePreprocessor (views of the raw BGRA buffer)
+with a straightforward pipeline that builds new arrays for every step, the
+way a PIL conversion or plain NumPy expressions would. Frames are synthetic
+BGRA buffers. Allocation is measured with tracemalloc (NumPy reports its array
+buffers to it) over the steady-state frames, after a warm-up frame.
+
+    python benchmarks/bench_preprocessing.py
+    python benchmarks/bench_preprocessing.py --sizes 300x40,1920x1080 --frames 500 --scale 3
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.capture import Frame, FramePreprocessor  # noqa: E402
+from pictor.capture.preprocessing import cv2  # noqa: E402
+
+
+def make_frames(width, height, count, rng):
+    """Light BGRA frames with a few dark strokes, as raw bytes like mss returns"""
+    frames = []
+    for sequence in range(count):
+        pixels = np.full((height, width, 4), 230, dtype=np.uint8)
+        for _ in range(max(1, width // 40)):
+            x = int(rng.integers(0, max(1, width - 10)))
+            y = int(rng.integers(0, max(1, height - 10)))
+            pixels[y:y + 10, x:x + 8, :3] = 25
+        frames.append(Frame(sequence, 0.0, width, height, pixels.tobytes()))
+    return frames
+
+
+def naive_pipeline(frame, scale):
+    """Copy-per-step reference: new arrays for the gray image, the mask and the scaled image"""
+    pixels = np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height, frame.width, 4).copy()
+    gray = ((pixels[..., 0].astype(np.uint16) * 29 + pixels[..., 1].astype(np.uint16) * 150 +
+             pixels[..., 2].astype(np.uint16) * 77) >> 8).astype(np.uint8)
+    ink = gray > (int(gray.min()) + int(gray.max())) // 2
+    if np.count_nonzero(ink) * 2 > ink.size:
+        ink = ~ink
+    scaled = np.repeat(np.repeat(ink, scale, axis=0), scale, axis=1)
+    return np.where(scaled, 0, 255).astype(np.uint8)
+
+
+def measure(process, frames):
+    """Mean and p95 per-frame time (ms) and bytes allocated per steady-state frame"""
+    process(frames[0])  # warm-up: buffers are allocated here
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    timings = [0.0] * (len(frames) - 1)  # preallocated so the list does not count as frame allocation
+    for index, frame in enumerate(frames[1:]):
+        start = time.perf_counter()
+        process(frame)
+        timings[index] = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    timings.sort()
+    return sum(timings) / len(timings), timings[int(len(timings) * 0.95) - 1], max(0, peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="300x40,600x60,1000x80,1920x1080",
+                        help="comma-separated WIDTHxHEIGHT regions")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--scale", type=int, default=2, help="integer upscaling of the output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"OpenCV: {'yes' if cv2 is not None else 'no (NumPy path)'}, scale {args.scale}, {args.frames} frames")
+    print(f"{'region':>10} {'pipeline':<14} {'mean ms':>9} {'p95 ms':>9} {'peak alloc':>12}")
+    for size in args.sizes.split(","):
+        width, height = (int(n) for n in size.strip().lower().split("x"))
+        frames = make_frames(width, height, args.frames, rng)
+        preprocessor = FramePreprocessor(scale=args.scale)
+        for name, process in (("naive", lambda f: naive_pipeline(f, args.scale)),
+                              ("preprocessor", preprocessor.scaled)):
+            mean, p95, allocated = measure(process, frames)
+            print(f"{size:>10} {name:<14} {mean:>9.3f} {p95:>9.3f} {allocated / 1024:>10.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Compare pickled and shared-memory frame hand-off to the OCR workers
+
+Pushes full-window BGRA frames at a fixed rate (30 FPS by default) through
+OCRPool with an instant stub backend, so the measurement is the hand-off
+itself: frames read per second, p95 latency from dispatch to result, and
+stale frames dropped because a worker was still busy. Also reports the
+parent's CPU time per frame, which includes pickling or the slot copy.
+
+    python benchmarks/bench_shared_frames.py
+    python benchmarks/bench_shared_frames.py --sizes 1920x1080,3840x2160 --fps 60 --workers 1
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.capture.capture_engine import Frame, FrameRing  # noqa: E402
+from pictor.capture.ocr_pool import OCRPool  # noqa: E402
+
+
+def run(width, height, shared, workers, fps, duration):
+    """Feed frames of one size at fps for duration seconds; return (stats, frames fed, CPU ms per frame)"""
+    data = bytes(bytearray(range(256)) * (width * height * 4 // 256 + 1))[:width * height * 4]
+    ring = FrameRing()
+    pool = OCRPool("stub", workers, backend_options={"text": "h_ll_"}, shared_frames=shared)
+    pool.start(ring)
+    try:
+        # Let the workers finish starting, and size the slots, before timing
+        ring.push(Frame(0, time.perf_counter(), width, height, data))
+        time.sleep(1.0)
+        warmup_read = pool.read
+
+        period = 1.0 / fps
+        cpu_start = time.process_time()
+        deadline = time.perf_counter()
+        end = deadline + duration
+        sequence = 0
+        while deadline < end:
+            sequence += 1
+            ring.push(Frame(sequence, time.perf_counter(), width, height, data))
+            deadline += period
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+        time.sleep(0.5)
+        cpu_ms = (time.process_time() - cpu_start) * 1000 / sequence
+        stats = pool.stats()
+        stats['read'] -= warmup_read
+        return stats, sequence, cpu_ms
+    finally:
+        pool.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1280x720,1920x1080,2560x1440", help="comma-separated WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per run")
+    args = parser.parse_args()
+
+    print(f"{args.fps:g} FPS, {args.workers} workers, {args.duration:g} s per run")
+    print(f"{'region':>10} {'hand-off':<8} {'fed':>5} {'read':>5} {'stale':>5} {'frames/s':>9} "
+          f"{'p95 ms':>8} {'CPU ms/frame':>13}")
+    for size in args.sizes.split(","):
+        width, height = (int(n) for n in size.strip().lower().split("x"))
+        for shared in (False, True):
+            stats, fed, cpu_ms = run(width, height, shared, args.workers, args.fps, args.duration)
+            name = "shared" if shared else "pickled"
+            if stats['error']:
+                print(f"{size:>10} {name:<8} error: {stats['error']}")
+                continue
+            print(f"{size:>10} {name:<8} {fed:>5} {stats['read']:>5} {stats['stale']:>5} "
+                  f"{stats['throughput']:>9.1f} {stats['p95_ms']:>8.2f} {cpu_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Compare the in-memory index engine with the SQLite wordbank
+
+Both engines are measured through WordFilter.filter_words, so the sqlite
+numbers include the WordFilter path (which builds no in-memory word list).
+The wordbank file is imported once up front. Each engine runs in its own
+child process so resident memory (RSS) is not shared between them. Reports the load/build time, the first ("cold") query
+right after loading, warm query latency and RSS after the queries.
+
+    python benchmarks/bench_sqlite_engine.py
+    python benchmarks/bench_sqlite_engine.py --sizes bundled,1000000 --queries 200
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+from bench_matching import bundled_words, make_bank_folder, sample_patterns, synthetic_words
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.word_filtering import WordFilter  # noqa: E402
+from pictor.utils.sqlite_wordbank import SQLiteWordBank  # noqa: E402
+
+
+def rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable), or None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+    except ImportError:
+        return None
+
+
+def run_child(args):
+    """Load one engine, answer the patterns and print the measurements as JSON"""
+    with open(args.patterns, encoding="utf-8") as f:
+        patterns = json.load(f)
+
+    start = time.perf_counter()
+    word_filter = WordFilter(wordlists_folder=args.folder, engine=args.child)
+    word_filter.wordbank_path = args.db
+    word_filter.update_selected_wordlists(["bank.txt"])
+    query = lambda p: word_filter.filter_words(p, args.exact)  # noqa: E731
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    query(patterns[0])
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    timings = []
+    for pattern in patterns[1:]:
+        start = time.perf_counter()
+        query(pattern)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    print(json.dumps({
+        "load_ms": load_ms,
+        "cold_ms": cold_ms,
+        "warm_mean_ms": sum(timings) / len(timings),
+        "warm_p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "rss_mb": rss_mb(),
+    }))
+
+
+def measure(engine, folder, db, patterns_file, exact):
+    """Run one engine in a child process"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", engine, "--folder", folder,
+               "--db", db, "--patterns", patterns_file]
+    if exact:
+        command.append("--exact")
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_bank(name, words, args, rng):
+    """Benchmark both engines on one word bank"""
+    root, folder = make_bank_folder(words)
+    try:
+        db = os.path.join(root, "wordbank.db")
+        start = time.perf_counter()
+        bank = SQLiteWordBank(db)
+        bank.sync(folder, ["bank.txt"])
+        bank.close()
+        sync_ms = (time.perf_counter() - start) * 1000
+
+        patterns_file = os.path.join(root, "patterns.json")
+        with open(patterns_file, "w", encoding="utf-8") as f:
+            json.dump(sample_patterns(words, args.queries, rng), f)
+
+        print(f"\n== {name}: {len(words)} words, {args.queries} patterns "
+              f"(sqlite import {sync_ms:.0f} ms, db {os.path.getsize(db) / 2 ** 20:.1f} MB)")
+        print(f"{'engine':<8} {'exact':<6} {'load ms':>10} {'cold ms':>10} {'warm ms':>10} {'p95 ms':>10} {'RSS MB':>8}")
+        for engine in ("index", "sqlite"):
+            for exact in (False, True):
+                result = measure(engine, folder, db, patterns_file, exact)
+                rss = f"{result['rss_mb']:.1f}" if result["rss_mb"] is not None else "n/a"
+                print(f"{engine:<8} {str(exact):<6} {result['load_ms']:>10.1f} {result['cold_ms']:>10.3f} "
+                      f"{result['warm_mean_ms']:>10.3f} {result['warm_p95_ms']:>10.3f} {rss:>8}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="bundled,1000000",
+                        help="comma-separated banks: 'bundled' and/or synthetic word counts")
+    parser.add_argument("--queries", type=int, default=100, help="patterns per bank")
+    parser.add_argument("--seed", type=int, default=0)
+    # Internal: run a single engine (used for the child processes)
+    parser.add_argument("--child", choices=("index", "sqlite"), help=argparse.SUPPRESS)
+    parser.add_argument("--folder", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--patterns", help=argparse.SUPPRESS)
+    parser.add_argument("--exact", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    rng = random.Random(args.seed)
+    seed_words = bundled_words()
+    for size in args.sizes.split(","):
+        size = size.strip()
+        if size == "bundled":
+            run_bank("bundled", seed_words, args, rng)
+        else:
+            count = int(size)
+            run_bank(f"synthetic {count}", synthetic_words(count, seed_words, rng), args, rng)
+
+
+if __name__ == "__main__":
+    main()
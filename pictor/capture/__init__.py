@@ -0,0 +1,14 @@
+# Screen capture and hint recognition
+from .capture_engine import CaptureEngine, FrameRing, Frame
+from .change_detection import ChangeDetector
+from .ocr_pool import OCRPool, OCRResult
+from .ocr_cache import OCRCache
+from .preprocessing import FramePreprocessor
+from .glyph_recognizer import GlyphRecognizer
+from .hint_shape import HintShape, HintShapeTracker, extract_hint_shape, fits_shape, merge_ocr_text
+from .stabilizer import ReadingStabilizer
+
+__all__ = ['CaptureEngine', 'FrameRing', 'Frame', 'ChangeDetector', 'OCRPool', 'OCRResult', 'OCRCache',
+           'FramePreprocessor', 'GlyphRecognizer', 'HintShape', 'HintShapeTracker', 'extract_hint_shape', 'fits_shape',
+           'merge_ocr_text',
+           'ReadingStabilizer']
@@ -0,0 +1,190 @@
+"""
+Screen capture on a dedicated thread
+
+CaptureEngine grabs the selected region with one mss instance, owned by the
+capture thread, at the configured rate. Ticks are scheduled against absolute
+deadlines so the rate does not drift. A tick that is already a full period
+late is skipped and counted as dropped. Frames go into a bounded ring buffer
+that overwrites the oldest frame, so a slow consumer never stalls capture. Frames that a
+ChangeDetector finds unchanged are not pushed at all, so OCR downstream only
+sees new hint states.
+"""
+import threading
+import time
+from collections import deque, namedtuple
+
+import mss
+
+from .change_detection import ChangeDetector
+
+# One captured frame: raw BGRA pixels (mss layout), row-major, width * height * 4 bytes
+Frame = namedtuple('Frame', ['sequence', 'timestamp', 'width', 'height', 'data'])
+
+
+class FrameRing:
+    """Bounded, thread-safe frame buffer that keeps the newest frames"""
+
+    def __init__(self, capacity=8):
+        self._frames = deque(maxlen=capacity)
+        self._ready = threading.Condition()
+        self.overwritten = 0  # frames evicted before anyone took them
+
+    def push(self, frame):
+        """Add a frame, evicting the oldest one if the buffer is full"""
+        with self._ready:
+            if len(self._frames) == self._frames.maxlen:
+                self.overwritten += 1
+            self._frames.append(frame)
+            self._ready.notify()
+
+    def pop(self, timeout=None):
+        """Take the oldest frame, waiting up to timeout seconds (None if nothing arrived)"""
+        with self._ready:
+            if not self._frames and not self._ready.wait_for(lambda: self._frames, timeout):
+                return None
+            return self._frames.popleft()
+
+    def latest(self):
+        """Peek at the newest frame without consuming it"""
+        with self._ready:
+            return self._frames[-1] if self._frames else None
+
+    def clear(self):
+        """Drop every buffered frame"""
+        with self._ready:
+            self._frames.clear()
+
+    def __len__(self):
+        return len(self._frames)
+
+
+class CaptureEngine:
+    """Captures a screen region at a fixed rate on a background thread"""
+
+    def __init__(self, fps=1.0, region=None, ring_capacity=8, change_detector=None):
+        self.ring = FrameRing(ring_capacity)
+        self.change_detector = change_detector or ChangeDetector()
+        self._fps = fps
+        self._region = region  # (left, top, width, height) in screen coordinates
+        self._thread = None
+        self._stop = threading.Event()
+
+        # Written only by the capture thread, read by the UI
+        self.captured = 0
+        self.dropped = 0
+        self.error = None
+        self._timestamps = deque(maxlen=64)
+
+    @property
+    def running(self):
+        """Whether the capture thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def fps(self):
+        return self._fps
+
+    @property
+    def region(self):
+        return self._region
+
+    def set_fps(self, fps):
+        """Change the capture rate (applied from the next tick)"""
+        self._fps = max(0.01, float(fps))
+
+    def set_region(self, region):
+        """Change the captured region (left, top, width, height)"""
+        self._region = tuple(region) if region else None
+
+    def start(self):
+        """Start capturing; returns False if no region is set"""
+        if self.running:
+            return True
+        if not self._region:
+            return False
+        self._stop.clear()
+        self.captured = self.dropped = 0
+        self.error = None
+        self._timestamps.clear()
+        self.ring.clear()
+        self.change_detector.reset()
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Stop capturing and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def stats(self):
+        """
+        Snapshot of the capture statistics (safe to call from the Tk thread)
+
+        Returns:
+            dict: running, target_fps, fps (achieved, over the recent frames),
+                  captured, dropped (ticks skipped because capture fell behind),
+                  overwritten (frames evicted from the ring unread),
+                  skip_ratio (frames dropped as unchanged), error
+        """
+        timestamps = list(self._timestamps)
+        achieved = 0.0
+        if len(timestamps) > 1 and timestamps[-1] > timestamps[0]:
+            achieved = (len(timestamps) - 1) / (timestamps[-1] - timestamps[0])
+        return {
+            'running': self.running,
+            'target_fps': self._fps,
+            'fps': achieved,
+            'captured': self.captured,
+            'dropped': self.dropped,
+            'overwritten': self.ring.overwritten,
+            'skip_ratio': self.change_detector.skip_ratio,
+            'error': self.error,
+        }
+
+    def _run(self):
+        """Capture thread: grab on absolute deadlines until stopped"""
+        try:
+            # mss handles are not shareable across threads, so the thread owns its instance
+            with mss.mss() as grabber:
+                self._capture_loop(grabber)
+        except Exception as e:
+            self.error = str(e)
+            print(f"[DEBUG] Capture stopped: {e}")
+
+    def _capture_loop(self, grabber):
+        """Grab frames until stopped; the schedule is re-anchored when the rate changes"""
+        period = 1.0 / self._fps
+        deadline = time.perf_counter()
+        sequence = 0
+        while not self._stop.is_set():
+            if 1.0 / self._fps != period:
+                period = 1.0 / self._fps
+                deadline = time.perf_counter()
+
+            now = time.perf_counter()
+            if now < deadline:
+                self._stop.wait(deadline - now)
+                continue
+
+            # Skip (and count) whole periods we are behind instead of bursting to catch up
+            missed = int((now - deadline) / period)
+            if missed:
+                self.dropped += missed
+                deadline += missed * period
+
+            region = self._region
+            if not region:
+                deadline += period
+                continue
+            left, top, width, height = region
+            shot = grabber.grab({'left': left, 'top': top, 'width': width, 'height': height})
+            sequence += 1
+            frame = Frame(sequence, now, shot.width, shot.height, shot.raw)
+            if self.change_detector.changed(frame):
+                self.ring.push(frame)
+            self.captured += 1
+            self._timestamps.append(now)
+            deadline += period
@@ -0,0 +1,74 @@
+"""
+Cheap frame-change detection so OCR only runs when the hint region changes
+
+A CRC of the raw capture buffer catches the common case of an identical frame
+without touching the pixels. Otherwise the frame is downsampled to a small
+grayscale grid (strided view + integer luma, no copies of the full frame) and
+compared with the last frame that was passed on. The frame counts as changed
+when enough samples moved by more than a few gray levels.
+"""
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # without numpy only byte-identical frames are skipped
+    np = None
+
+# Gray levels a sample must move by to count as changed (absorbs compression noise)
+PIXEL_DELTA = 24
+# Longest side of the downsampled grid
+SAMPLE_SIZE = 160
+
+
+class ChangeDetector:
+    """Decides whether a captured frame differs enough from the last one to re-read"""
+
+    def __init__(self, threshold=0.005):
+        self.threshold = threshold  # fraction of samples that must change
+        self._last_crc = None
+        self._last_gray = None
+
+        self.frames = 0
+        self.skipped = 0
+
+    @property
+    def skip_ratio(self):
+        """Fraction of frames skipped as unchanged"""
+        return self.skipped / self.frames if self.frames else 0.0
+
+    def reset(self):
+        """Forget the previous frame and the counters"""
+        self._last_crc = None
+        self._last_gray = None
+        self.frames = self.skipped = 0
+
+    def changed(self, frame):
+        """Check (and remember) a frame; the first frame always counts as changed"""
+        self.frames += 1
+        crc = zlib.crc32(frame.data)
+        if crc == self._last_crc:
+            self.skipped += 1
+            return False
+        self._last_crc = crc
+
+        if np is None:
+            return True
+        gray = self._downsample(frame)
+        last = self._last_gray
+        if last is not None and last.shape == gray.shape:
+            moved = np.count_nonzero(np.abs(gray - last) > PIXEL_DELTA)
+            if moved < self.threshold * gray.size:
+                # Keep comparing with the last frame passed on, so a slow fade still adds up
+                self.skipped += 1
+                return False
+        self._last_gray = gray
+        return True
+
+    @staticmethod
+    def _downsample(frame):
+        """Strided grayscale samples of a BGRA frame (signed, so differences cannot wrap)"""
+        pixels = np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height, frame.width, 4)
+        step = max(1, max(frame.width, frame.height) // SAMPLE_SIZE)
+        sampled = pixels[::step, ::step].astype(np.int32)
+        # Integer Rec. 601 luma from the B, G, R channels
+        return (sampled[..., 0] * 29 + sampled[..., 1] * 150 + sampled[..., 2] * 77) >> 8
@@ -0,0 +1,134 @@
+"""
+Template-matching recognizer for the fixed hint font
+
+Hint lines are drawn in one font at one size, so the same character always
+produces the same bitmap. The line is binarized and split into glyph slots by
+column projection; wide gaps become spaces. Each slot is looked up by its
+exact bitmap, then compared against learned templates of the same size.
+Underscores and dashes are recognized by shape. Only glyphs never seen before
+go to the (slow) fallback reader, and its answer is learned for next time.
+"""
+import numpy as np
+
+from .preprocessing import FramePreprocessor
+
+# A gap this many times the typical inter-glyph gap separates words
+SPACE_GAP_RATIO = 2.5
+
+
+def binarize(gray):
+    """Ink mask of a grayscale line (a new array; frames go through a reused FramePreprocessor)"""
+    return FramePreprocessor().ink_from_gray(gray)
+
+
+def segment(ink):
+    """
+    Split an ink mask into glyph slots
+
+    Returns:
+        tuple: (top, bottom) of the line's ink rows and a list of (x0, x1)
+               column spans, with None wherever a word gap (space) falls
+    """
+    rows = np.flatnonzero(ink.any(axis=1))
+    if not len(rows):
+        return (0, 0), []
+    columns = ink.any(axis=0).astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], columns, [0]))))
+    starts, ends = edges[0::2], edges[1::2]
+
+    gaps = starts[1:] - ends[:-1]
+    space_gap = SPACE_GAP_RATIO * float(np.median(gaps)) if len(gaps) else 0.0
+    slots = [(int(starts[0]), int(ends[0]))]
+    for gap, start, end in zip(gaps, starts[1:], ends[1:]):
+        if len(gaps) > 1 and gap > space_gap:
+            slots.append(None)
+        slots.append((int(start), int(end)))
+    return (int(rows[0]), int(rows[-1]) + 1), slots
+
+
+def bar_char(glyph):
+    """Underscores and dashes are flat bars, recognized by position: '_', '-' or None for other glyphs"""
+    rows = np.flatnonzero(glyph.any(axis=1))
+    ink_height = rows[-1] - rows[0] + 1
+    if ink_height * 3 > glyph.shape[1]:
+        return None
+    # Bars sitting on the bottom of the line are underscores, raised ones dashes
+    # (a line of nothing but bars is all underscores)
+    if ink_height == glyph.shape[0] or rows[-1] >= glyph.shape[0] * 0.7:
+        return '_'
+    return '-'
+
+
+class GlyphRecognizer:
+    """Reads hint lines by matching glyph bitmaps against learned templates"""
+
+    def __init__(self, fallback=None, max_distance=0.08):
+        self.fallback = fallback  # callable(bool glyph array) -> str, for unseen glyphs
+        self.max_distance = max_distance  # fraction of differing pixels for a near match
+        self.templates = {}  # (height, width, packed bits) -> char
+        self._by_shape = {}  # (height, width) -> (stacked template bitmaps, chars)
+        self.preprocessor = FramePreprocessor()
+        self.hits = 0
+        self.misses = 0
+        self.uncertain = 0  # glyphs answered by the fallback or not at all
+        self.last_confidence = 1.0  # share of the last line's glyphs known from templates or shape
+
+    def read(self, frame):
+        """Read the hint text of a raw BGRA frame"""
+        return self.read_ink(self.preprocessor.ink(frame))
+
+    def read_gray(self, gray):
+        """Read the hint text of a grayscale line image"""
+        return self.read_ink(binarize(gray))
+
+    def read_ink(self, ink):
+        """Read the hint text of a binarized line"""
+        (top, bottom), slots = segment(ink)
+        line = ink[top:bottom]
+        uncertain = self.uncertain
+        text = ''.join(' ' if slot is None else self.classify(line[:, slot[0]:slot[1]]) for slot in slots)
+        glyphs = len(text) - text.count(' ')
+        self.last_confidence = 1.0 - (self.uncertain - uncertain) / glyphs if glyphs else 0.0
+        return text
+
+    def classify(self, glyph):
+        """Recognize one glyph slot (cropped to the line's ink rows)"""
+        shape_char = bar_char(glyph)
+        if shape_char:
+            return shape_char
+
+        key = (glyph.shape[0], glyph.shape[1], np.packbits(glyph).tobytes())
+        char = self.templates.get(key)
+        if char is not None:
+            self.hits += 1
+            return char
+
+        char = self._nearest(glyph)
+        if char is None:
+            self.uncertain += 1
+            if self.fallback is not None:
+                self.misses += 1
+                char = (self.fallback(glyph) or '')[:1] or None
+        if char is None:
+            return '?'
+        self.learn(glyph, char, key)
+        return char
+
+    def learn(self, glyph, char, key=None):
+        """Remember the character a glyph bitmap stands for"""
+        key = key or (glyph.shape[0], glyph.shape[1], np.packbits(glyph).tobytes())
+        self.templates[key] = char
+        bitmaps, chars = self._by_shape.get(glyph.shape, (np.zeros((0, glyph.size), dtype=bool), []))
+        self._by_shape[glyph.shape] = (np.vstack([bitmaps, glyph.reshape(1, -1)]), chars + [char])
+
+    def _nearest(self, glyph):
+        """Closest learned template of the same size, if within max_distance"""
+        entry = self._by_shape.get(glyph.shape)
+        if entry is None:
+            return None
+        bitmaps, chars = entry
+        distances = np.count_nonzero(bitmaps != glyph.reshape(1, -1), axis=1)
+        best = int(np.argmin(distances))
+        if distances[best] <= self.max_distance * glyph.size:
+            return chars[best]
+        return None
@@ -0,0 +1,84 @@
+"""
+Word shape of the hint line, read without OCR
+
+The hint row shows one slot per letter: an underscore bar while hidden, the
+letter once revealed, and a wider gap between words. Counting the slots and
+the gaps gives a pattern filter_words accepts in exact-length mode even when
+no letter can be read (e.g. "_____ _____" for a two-word answer). Revealed
+letters are left as "_" here; merge_ocr_text fills them from an OCR reading.
+"""
+from collections import namedtuple
+
+from .glyph_recognizer import bar_char, binarize, segment
+from .preprocessing import FramePreprocessor
+
+# pattern: filter_words pattern ("_" unknown letter, " " word gap, letters/dashes literal)
+# slots: number of letter slots; groups: (start, end) pattern indices of each word
+HintShape = namedtuple('HintShape', ['pattern', 'slots', 'groups'])
+
+
+def extract_hint_shape(gray):
+    """
+    Read the slot layout of a grayscale hint line
+
+    Args:
+        gray: 2-D uint8 array of the hint region
+
+    Returns:
+        HintShape, or None if the region holds no glyphs
+    """
+    return shape_from_ink(binarize(gray))
+
+
+def shape_from_ink(ink):
+    """Read the slot layout of a binarized hint line (see extract_hint_shape)"""
+    (top, bottom), spans = segment(ink)
+    if not spans:
+        return None
+    line = ink[top:bottom]
+
+    chars = []
+    for span in spans:
+        if span is None:
+            chars.append(' ')
+            continue
+        # Bars and dashes are literal; a revealed letter is an unknown slot until OCR reads it
+        chars.append(bar_char(line[:, span[0]:span[1]]) or '_')
+
+    pattern = ''.join(chars)
+    groups = []
+    start = 0
+    for word in pattern.split(' '):
+        groups.append((start, start + len(word)))
+        start += len(word) + 1
+    return HintShape(pattern, len(pattern) - pattern.count(' '), groups)
+
+
+def fits_shape(pattern, text):
+    """Check whether an OCR reading has the length and word gaps of a shape pattern"""
+    if not text or len(text) != len(pattern):
+        return False
+    return all((a == ' ') == (b == ' ') for a, b in zip(pattern, text))
+
+
+def merge_ocr_text(pattern, text):
+    """Fill unknown slots of a shape pattern with letters OCR read at the same positions"""
+    if not fits_shape(pattern, text):
+        return pattern
+    return ''.join(b.lower() if a == '_' and b.isalnum() else a for a, b in zip(pattern, text))
+
+
+class HintShapeTracker:
+    """Keeps the shape of the newest captured frame (updated from the OCR feed thread)"""
+
+    def __init__(self):
+        self.preprocessor = FramePreprocessor()
+        self.latest = None  # (frame sequence, HintShape or None if the frame held no glyphs)
+
+    def update(self, frame):
+        """Extract the shape of a captured frame"""
+        self.latest = (frame.sequence, shape_from_ink(self.preprocessor.ink(frame)))
+
+    def reset(self):
+        """Forget the last shape (e.g. when monitoring starts, so a previous session's hint is not voted)"""
+        self.latest = None
@@ -0,0 +1,128 @@
+"""
+Perceptual-hash cache of OCR readings
+
+The same hint image comes back again and again: one partial reveal lasts
+many frames, and the same words return in later rounds. Each frame's ink is
+cropped to its bounding box and reduced to a difference hash (dHash): one
+bit per pair of neighbouring cells of a small grid of block means. The hash
+ignores where the hint sits in the region and small antialiasing noise. It
+still separates different letters, because the grid is wide enough to give
+every glyph several columns. Readings are kept per hash in an LRU table and
+can be saved across sessions.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .preprocessing import FramePreprocessor
+
+OCR_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "ocr_cache.json")
+
+# dHash grid: rows x columns of block means (columns + 1 are sampled to compare neighbours)
+HASH_ROWS = 16
+HASH_COLUMNS = 128
+
+
+def dhash(ink, rows=HASH_ROWS, columns=HASH_COLUMNS):
+    """
+    Difference hash of an ink mask, cropped to the ink's bounding box
+
+    Returns:
+        str: Hex key that also encodes the bounding-box size, or None if there is no ink
+    """
+    ink_rows = np.flatnonzero(ink.any(axis=1))
+    ink_columns = np.flatnonzero(ink.any(axis=0))
+    if not len(ink_rows):
+        return None
+    box = ink[ink_rows[0]:ink_rows[-1] + 1, ink_columns[0]:ink_columns[-1] + 1]
+    height, width = box.shape
+    # Block means over a (rows, columns + 1) grid; boxes smaller than the grid repeat cells
+    row_edges = np.minimum(np.arange(rows) * height // rows, height - 1)
+    column_edges = np.minimum(np.arange(columns + 1) * width // (columns + 1), width - 1)
+    sums = np.add.reduceat(np.add.reduceat(box.astype(np.uint16), row_edges, axis=0), column_edges, axis=1)
+    bits = np.packbits(sums[:, 1:] > sums[:, :-1])
+    return f"{height}x{width}:{bits.tobytes().hex()}"
+
+
+class OCRCache:
+    """LRU table from the perceptual hash of a hint image to its (text, confidence) reading"""
+
+    def __init__(self, capacity=512, path=None, backend=None):
+        self.capacity = capacity
+        self.path = path  # JSON file to persist to, or None to keep the cache in memory only
+        self.backend = backend  # readings of another backend are not loaded
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._preprocessor = FramePreprocessor()
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self.load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def key(self, frame):
+        """Hash key of a raw frame (called from one thread: the preprocessor buffers are reused)"""
+        return dhash(self._preprocessor.ink(frame))
+
+    def get(self, key):
+        """Cached (text, confidence) for a key, or None; counts the hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, text, confidence):
+        """Remember a reading, evicting the least recently used one when full"""
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = (text, confidence)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+    def load(self):
+        """Load readings saved by an earlier session with the same backend"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('backend') != self.backend:
+                return
+            with self._lock:
+                for key, text, confidence in data.get('entries', [])[-self.capacity:]:
+                    self._entries[key] = (text, confidence)
+        except Exception as e:
+            print(f"Failed to load OCR cache: {e}")
+
+    def save(self):
+        """Write the readings to the cache file, least recently used first"""
+        if not self.path:
+            return
+        try:
+            with self._lock:
+                entries = [[key, text, confidence] for key, (text, confidence) in self._entries.items()]
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'backend': self.backend, 'entries': entries}, f)
+        except Exception as e:
+            print(f"Failed to save OCR cache: {e}")
@@ -0,0 +1,377 @@
+"""
+OCR stage: a fixed pool of long-lived worker processes
+
+Each worker creates its OCR backend once and keeps it for its whole life.
+With tesserocr installed, the Tesseract engine stays loaded in the worker.
+Without it, pytesseract still starts the tesseract CLI for every call, but
+never on the capture or Tk threads.
+
+Frames wait in a small parent-side buffer that keeps only the newest ones,
+and are handed to a worker only when one is idle. A burst of frames therefore
+never builds a backlog: stale frames are dropped, not read late. Dispatched
+frames travel through shared-memory slots rather than being pickled. With an
+OCRCache, a hint image read before is answered from the cache and never
+reaches a worker.
+"""
+import multiprocessing
+import threading
+import time
+from collections import deque, namedtuple
+
+from .glyph_recognizer import GlyphRecognizer
+from .preprocessing import FramePreprocessor
+from .shared_frames import SharedFrameReader, SharedFrameRef, SharedFrameSlots
+
+# Characters that can appear in a hint line
+HINT_WHITELIST = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-'"
+# Single text line (--psm 7) or character (--psm 10), LSTM engine, no dictionary correction
+# (hints are not dictionary words)
+TESSERACT_CONFIG = (f"--psm 7 --oem 1 -c tessedit_char_whitelist={HINT_WHITELIST} "
+                    "-c load_system_dawg=0 -c load_freq_dawg=0 -c preserve_interword_spaces=1")
+TESSERACT_CHAR_CONFIG = TESSERACT_CONFIG.replace("--psm 7", "--psm 10")
+# Hint text is small; Tesseract reads upscaled, binarized glyphs more reliably
+TESSERACT_SCALE = 2
+
+# One OCR reading of a frame; confidence runs from 0 to 1
+OCRResult = namedtuple('OCRResult', ['sequence', 'text', 'confidence', 'latency_ms'])
+
+
+class TesseractBackend:
+    """Tesseract with the hint-line configuration; keeps the engine loaded when tesserocr is available"""
+
+    def __init__(self, config=TESSERACT_CONFIG, single_char=False, crop=None, threshold=None, scale=TESSERACT_SCALE):
+        self.config = TESSERACT_CHAR_CONFIG if single_char and config == TESSERACT_CONFIG else config
+        self._api = None
+        # Frames are cropped, thresholded and upscaled in reused buffers before they reach Tesseract
+        self._preprocessor = FramePreprocessor(crop, threshold, scale)
+        self.last_confidence = 1.0  # pytesseract's text output carries no confidence
+        try:
+            import tesserocr
+            psm = tesserocr.PSM.SINGLE_CHAR if single_char else tesserocr.PSM.SINGLE_LINE
+            self._api = tesserocr.PyTessBaseAPI(psm=psm, oem=tesserocr.OEM.LSTM_ONLY)
+            self._api.SetVariable("tessedit_char_whitelist", HINT_WHITELIST)
+            self._api.SetVariable("load_system_dawg", "0")
+            self._api.SetVariable("load_freq_dawg", "0")
+            self._api.SetVariable("preserve_interword_spaces", "1")
+        except ImportError:
+            import pytesseract
+            self._pytesseract = pytesseract
+
+    def read(self, frame):
+        """Read the hint text of a frame"""
+        from PIL import Image
+        return self.read_image(Image.fromarray(self._preprocessor.scaled(frame), 'L'))
+
+    def read_image(self, image):
+        """Read the text of a PIL image"""
+        if self._api is not None:
+            self._api.SetImage(image)
+            text = self._api.GetUTF8Text().strip()
+            self.last_confidence = self._api.MeanTextConf() / 100
+            return text
+        return self._pytesseract.image_to_string(image, config=self.config).strip()
+
+
+class GlyphBackend:
+    """Template matching for the fixed hint font, asking Tesseract only about unseen glyphs"""
+
+    # Blank border and upscaling that help Tesseract read an isolated glyph
+    GLYPH_PADDING = 8
+    GLYPH_SCALE = 3
+
+    def __init__(self):
+        self._tesseract = TesseractBackend(single_char=True)
+        self.recognizer = GlyphRecognizer(self._read_glyph)
+
+    def _read_glyph(self, glyph):
+        """Fallback: render a glyph bitmap as dark-on-light and read it as one character"""
+        import numpy as np
+        from PIL import Image
+        pixels = np.where(glyph, 0, 255).astype(np.uint8)
+        pixels = np.pad(pixels, self.GLYPH_PADDING, constant_values=255)
+        image = Image.fromarray(pixels, 'L')
+        image = image.resize((image.width * self.GLYPH_SCALE, image.height * self.GLYPH_SCALE), Image.NEAREST)
+        return self._tesseract.read_image(image)
+
+    @property
+    def last_confidence(self):
+        return self.recognizer.last_confidence
+
+    def read(self, frame):
+        return self.recognizer.read(frame)
+
+
+class StubBackend:
+    """Local stand-in for tests and benchmarks: returns fixed text after a fixed delay"""
+
+    def __init__(self, text="", delay=0.0, confidence=1.0):
+        self.text = text
+        self.delay = delay
+        self.last_confidence = confidence
+
+    def read(self, frame):
+        if self.delay:
+            time.sleep(self.delay)
+        return self.text
+
+
+OCR_BACKENDS = {
+    "tesseract": TesseractBackend,
+    "glyphs": GlyphBackend,
+    "stub": StubBackend,
+}
+
+
+def _worker_main(backend_name, backend_options, tasks, results):
+    """Worker process: build the backend once, then read frames until told to stop"""
+    try:
+        backend = OCR_BACKENDS[backend_name](**backend_options)
+    except Exception as e:
+        results.put(('error', None, f"{backend_name} backend unavailable: {e}"))
+        return
+    shared = SharedFrameReader()
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        frame = shared.frame(task) if isinstance(task, SharedFrameRef) else task
+        if frame is None:
+            results.put(('error', task.sequence, "Frame slot was recycled before it was read"))
+            continue
+        try:
+            text = backend.read(frame)
+            results.put(('text', frame.sequence, (text, backend.last_confidence)))
+        except Exception as e:
+            results.put(('error', frame.sequence, str(e)))
+        finally:
+            if isinstance(frame.data, memoryview):
+                frame.data.release()
+    shared.close()
+
+
+class OCRPool:
+    """Feeds frames from a FrameRing to long-lived OCR worker processes"""
+
+    def __init__(self, backend="tesseract", workers=2, backlog=1, backend_options=None, on_frame=None,
+                 shared_frames=True, cache=None):
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.on_frame = on_frame  # callable(frame), run on the feed thread for every frame taken from the ring
+        self.worker_count = workers
+        self.shared_frames = shared_frames  # hand frames over in shared memory instead of pickling them
+        self.cache = cache  # OCRCache answering repeated hint images without a worker
+        self._cache_keys = {}  # sequence -> cache key of a frame waiting for or in OCR
+        self._pending = deque(maxlen=backlog)  # newest frames waiting for an idle worker
+        self._lock = threading.Condition()
+        self._in_flight = {}  # sequence -> dispatch time
+        self._slots = None  # SharedFrameSlots, sized on the first frame
+        self._slot_of = {}  # sequence -> slot of a frame in flight
+        self._processes = []
+        self._threads = []
+        self._tasks = None
+        self._results = None
+        self._stop = threading.Event()
+
+        self.latest = None  # newest OCRResult
+        self.error = None
+        self.read = 0
+        self.stale = 0  # frames dropped because newer ones arrived first
+        self._latencies = deque(maxlen=100)
+        self._finished = deque(maxlen=100)
+
+    @property
+    def running(self):
+        return bool(self._processes)
+
+    def start(self, ring):
+        """Start the workers and feed them frames from ring"""
+        if self.running:
+            return
+        context = multiprocessing.get_context('spawn')
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._stop.clear()
+        self.latest = self.error = None
+        self.read = self.stale = 0
+        self._latencies.clear()
+        self._finished.clear()
+        self._in_flight.clear()
+        self._pending.clear()
+        self._cache_keys.clear()
+        if self.cache is not None:
+            self.cache.reset_stats()
+        self._processes = [
+            context.Process(target=_worker_main, name=f"ocr-{i}", daemon=True,
+                            args=(self.backend, self.backend_options, self._tasks, self._results))
+            for i in range(self.worker_count)
+        ]
+        for process in self._processes:
+            process.start()
+        self._threads = [
+            threading.Thread(target=self._feed, args=(ring,), name="ocr-feed", daemon=True),
+            threading.Thread(target=self._dispatch, name="ocr-dispatch", daemon=True),
+            threading.Thread(target=self._collect, name="ocr-collect", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        """Stop feeding and shut the workers down"""
+        if not self.running:
+            return
+        self._stop.set()
+        with self._lock:
+            self._lock.notify_all()
+        for _ in self._processes:
+            self._tasks.put(None)
+        self._results.put(None)
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        for process in self._processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        # Frames a dead worker never took must not block interpreter exit
+        self._tasks.cancel_join_thread()
+        self._tasks.close()
+        self._results.close()
+        if self._slots is not None:
+            self._slots.close()
+            self._slots = None
+        self._slot_of.clear()
+        self._processes = []
+        self._threads = []
+        if self.cache is not None:
+            self.cache.save()
+
+    def submit(self, frame):
+        """Queue a frame for OCR, displacing the oldest waiting frame if the backlog is full"""
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self.stale += 1
+                self._cache_keys.pop(self._pending[0].sequence, None)
+            self._pending.append(frame)
+            self._lock.notify_all()
+
+    def stats(self):
+        """
+        Snapshot of the OCR statistics (safe to call from the Tk thread)
+
+        Returns:
+            dict: running, read, stale, throughput (frames/s over recent results),
+                  p95_ms (latency from dispatch to result), text, error,
+                  cache_hit_rate (None without a cache)
+        """
+        finished = list(self._finished)
+        throughput = 0.0
+        if len(finished) > 1 and finished[-1] > finished[0]:
+            throughput = (len(finished) - 1) / (finished[-1] - finished[0])
+        if self._processes and not self.error and not any(p.is_alive() for p in self._processes):
+            self.error = "OCR workers exited"
+        latencies = sorted(self._latencies)
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)] if latencies else 0.0
+        return {
+            'running': self.running,
+            'read': self.read,
+            'stale': self.stale,
+            'throughput': throughput,
+            'p95_ms': p95,
+            'text': self.latest.text if self.latest else None,
+            'error': self.error,
+            'cache_hit_rate': self.cache.hit_rate if self.cache is not None else None,
+        }
+
+    def _feed(self, ring):
+        """Move frames from the capture ring into the pending buffer"""
+        while not self._stop.is_set():
+            frame = ring.pop(timeout=0.2)
+            if frame is not None:
+                if self.on_frame is not None:
+                    try:
+                        self.on_frame(frame)
+                    except Exception as e:
+                        self.error = f"Frame callback failed: {e}"
+                if self.cache is not None and self._answer_from_cache(frame):
+                    continue
+                self.submit(frame)
+
+    def _answer_from_cache(self, frame):
+        """Record a cached reading for a frame; on a miss, remember its key for the worker's result"""
+        started = time.perf_counter()
+        key = self.cache.key(frame)
+        cached = self.cache.get(key)
+        if cached is None:
+            with self._lock:
+                self._cache_keys[frame.sequence] = key
+            return False
+        text, confidence = cached
+        now = time.perf_counter()
+        self._record(frame.sequence, text, confidence, (now - started) * 1000, now)
+        return True
+
+    def _dispatch(self):
+        """Hand the newest pending frame to a worker whenever one is idle"""
+        while True:
+            with self._lock:
+                self._lock.wait_for(lambda: self._stop.is_set() or
+                                    (self._pending and len(self._in_flight) < self.worker_count))
+                if self._stop.is_set():
+                    return
+                frame = self._pending.pop()
+                # Anything older than the frame being dispatched is stale
+                self.stale += len(self._pending)
+                for stale in self._pending:
+                    self._cache_keys.pop(stale.sequence, None)
+                self._pending.clear()
+                self._in_flight[frame.sequence] = time.perf_counter()
+                slots = self._slots_for(frame) if self.shared_frames else None
+            task = slots.write(frame) if slots is not None else None
+            if task is not None:
+                with self._lock:
+                    self._slot_of[frame.sequence] = task.slot
+            self._tasks.put(task or frame)
+
+    def _slots_for(self, frame):
+        """Slots that fit the frame (re-created when idle if frames grew), or None to pickle this one"""
+        if self._slots is not None and self._slots.fits(frame):
+            return self._slots
+        if len(self._in_flight) > 1:
+            # Workers still read the old slots; send this frame pickled
+            return None
+        if self._slots is not None:
+            self._slots.close()
+        # One slot per worker can ever be in flight
+        self._slots = SharedFrameSlots(self.worker_count, len(frame.data))
+        return self._slots
+
+    def _collect(self):
+        """Record worker results, keeping only readings newer than the latest one"""
+        while True:
+            item = self._results.get()
+            if item is None:
+                return
+            kind, sequence, value = item
+            now = time.perf_counter()
+            with self._lock:
+                started = self._in_flight.pop(sequence, None)
+                slot = self._slot_of.pop(sequence, None)
+                if slot is not None:
+                    self._slots.release(slot)
+                key = self._cache_keys.pop(sequence, None)
+                self._lock.notify_all()
+            if kind == 'error':
+                self.error = value
+                continue
+            text, confidence = value
+            if self.cache is not None:
+                self.cache.put(key, text, confidence)
+            latency_ms = (now - started) * 1000 if started is not None else 0.0
+            self._record(sequence, text, confidence, latency_ms, now)
+
+    def _record(self, sequence, text, confidence, latency_ms, now):
+        """Count a reading and keep it if it is the newest"""
+        self.read += 1
+        self._latencies.append(latency_ms)
+        self._finished.append(now)
+        if self.latest is None or sequence > self.latest.sequence:
+            self.latest = OCRResult(sequence, text, confidence, latency_ms)
@@ -0,0 +1,121 @@
+"""
+Frame preprocessing on views of the capture buffer
+
+Crop, BGRA to gray, threshold and integer upscaling all read from a NumPy view
+of the raw mss buffer (no PIL image, no copy of the frame) and write into
+output arrays that are allocated once and reused. Allocation per frame is
+therefore zero until the crop size changes. The arrays returned are those
+reused buffers: they are only valid until the next frame is processed.
+"""
+import numpy as np
+
+try:
+    import cv2
+except ImportError:  # the NumPy path produces the same arrays, somewhat slower
+    cv2 = None
+
+# Integer BT.601 luma weights (sum 256) for B, G, R
+_LUMA_WEIGHTS = (29, 150, 77)
+
+
+def bgra_view(frame):
+    """Zero-copy (height, width, 4) uint8 view of a frame's raw BGRA buffer"""
+    return np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.height, frame.width, 4)
+
+
+class FramePreprocessor:
+    """Turns raw BGRA frames into grayscale and ink-mask arrays without per-frame allocation"""
+
+    def __init__(self, crop=None, threshold=None, scale=1):
+        self.crop = crop  # (x, y, width, height) inside the frame, or None for the whole frame
+        self.threshold = threshold  # fixed gray threshold, or None for Otsu (midrange without cv2)
+        self.scale = max(1, int(scale))  # integer upscaling of the ink mask (e.g. for Tesseract)
+        self._shape = None
+        self._gray = None
+        self._ink = None
+        self._scaled = None
+        self._accumulator = None
+        self._channel = None
+
+    def _ensure_buffers(self, height, width):
+        """(Re)allocate the output arrays when the crop size changes"""
+        if self._shape == (height, width):
+            return
+        self._shape = (height, width)
+        self._gray = np.empty((height, width), dtype=np.uint8)
+        # uint8 0/1 so cv2 can write into it; viewed as bool for callers
+        self._ink = np.empty((height, width), dtype=np.uint8)
+        self._scaled = np.empty((height * self.scale, width * self.scale), dtype=np.uint8)
+        if cv2 is None:
+            self._accumulator = np.empty((height, width), dtype=np.uint16)
+            self._channel = np.empty((height, width), dtype=np.uint16)
+
+    def _cropped(self, frame):
+        """Zero-copy BGRA view of the crop rectangle"""
+        pixels = bgra_view(frame)
+        if self.crop is None:
+            return pixels
+        x, y, width, height = self.crop
+        return pixels[y:y + height, x:x + width]
+
+    def gray(self, frame):
+        """Grayscale of the cropped frame (reused uint8 buffer)"""
+        pixels = self._cropped(frame)
+        self._ensure_buffers(pixels.shape[0], pixels.shape[1])
+        if cv2 is not None:
+            cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY, dst=self._gray)
+            return self._gray
+        accumulator, channel = self._accumulator, self._channel
+        # Widen each channel into a contiguous buffer first; arithmetic on the strided view is slower
+        np.copyto(accumulator, pixels[..., 0])
+        np.multiply(accumulator, _LUMA_WEIGHTS[0], out=accumulator)
+        for index in (1, 2):
+            np.copyto(channel, pixels[..., index])
+            np.multiply(channel, _LUMA_WEIGHTS[index], out=channel)
+            np.add(accumulator, channel, out=accumulator)
+        np.right_shift(accumulator, 8, out=accumulator)
+        np.copyto(self._gray, accumulator, casting='unsafe')
+        return self._gray
+
+    def ink_from_gray(self, gray):
+        """Ink mask of a grayscale line: whichever side of the threshold is the minority (reused bool buffer)"""
+        self._ensure_buffers(gray.shape[0], gray.shape[1])
+        ink = self._ink.view(bool)
+        if cv2 is not None:
+            if self.threshold is None:
+                cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=self._ink)
+            else:
+                cv2.threshold(gray, self.threshold, 1, cv2.THRESH_BINARY, dst=self._ink)
+        else:
+            threshold = self.threshold
+            if threshold is None:
+                threshold = (int(gray.min()) + int(gray.max())) // 2
+            np.greater(gray, threshold, out=ink)
+        if np.count_nonzero(self._ink) * 2 > self._ink.size:
+            np.logical_not(ink, out=ink)
+        return ink
+
+    def ink(self, frame):
+        """Ink mask of the cropped frame"""
+        return self.ink_from_gray(self.gray(frame))
+
+    def scaled(self, frame):
+        """Dark-on-light, upscaled binary image of the cropped frame (reused uint8 buffer)"""
+        ink = self.ink(frame)
+        height, width = ink.shape
+        if cv2 is not None:
+            if self.scale == 1:
+                np.copyto(self._scaled, self._ink)
+            else:
+                cv2.resize(self._ink, (width * self.scale, height * self.scale), dst=self._scaled,
+                           interpolation=cv2.INTER_NEAREST)
+        else:
+            # One strided copy of the mask per position in the scale x scale block: faster than a
+            # 4-D broadcast, and never copying within the output avoids NumPy's overlap temporaries
+            for row in range(self.scale):
+                for column in range(self.scale):
+                    self._scaled[row::self.scale, column::self.scale] = self._ink
+        # 1 (ink) -> 0, 0 -> 255, in place
+        np.subtract(1, self._scaled, out=self._scaled)
+        np.multiply(self._scaled, 255, out=self._scaled)
+        return self._scaled
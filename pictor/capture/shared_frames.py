@@ -0,0 +1,94 @@
+"""
+Shared-memory frame slots for handing frames to the OCR worker processes
+
+A frame sent through a multiprocessing queue is pickled, written through a
+pipe and unpickled: three copies of every image. Here the pool copies each
+frame once into a free shared-memory slot and sends only a small reference
+(slot, block name, sequence, size). The worker maps the slot and reads the
+pixels in place. A slot returns to the free list once the worker's result
+for it has arrived. Each slot starts with the sequence number of the frame it
+holds, so a worker can tell a recycled slot from the frame it was sent.
+"""
+import struct
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from .capture_engine import Frame
+
+# Slot header: sequence number of the frame currently in the slot
+_HEADER = struct.Struct('<Q')
+
+# What a worker receives in place of a pickled frame
+SharedFrameRef = namedtuple('SharedFrameRef', ['slot', 'name', 'sequence', 'timestamp', 'width', 'height'])
+
+
+class SharedFrameSlots:
+    """Fixed set of shared-memory frame slots owned by the pool (parent side)"""
+
+    def __init__(self, slot_count, slot_size):
+        self.slot_size = slot_size  # bytes of pixel data a slot can hold
+        self._blocks = [shared_memory.SharedMemory(create=True, size=_HEADER.size + slot_size)
+                        for _ in range(slot_count)]
+        self._free = list(range(slot_count))
+
+    @property
+    def free_count(self):
+        return len(self._free)
+
+    def fits(self, frame):
+        """Whether a frame is small enough for the slots"""
+        return len(frame.data) <= self.slot_size
+
+    def write(self, frame):
+        """
+        Copy a frame into a free slot
+
+        Returns:
+            SharedFrameRef, or None if no slot is free or the frame does not fit
+        """
+        if not self._free or not self.fits(frame):
+            return None
+        slot = self._free.pop()
+        block = self._blocks[slot]
+        size = len(frame.data)
+        block.buf[_HEADER.size:_HEADER.size + size] = frame.data
+        _HEADER.pack_into(block.buf, 0, frame.sequence)
+        return SharedFrameRef(slot, block.name, frame.sequence, frame.timestamp, frame.width, frame.height)
+
+    def release(self, slot):
+        """Return a slot to the free list once its frame has been read"""
+        self._free.append(slot)
+
+    def close(self):
+        """Unmap and remove every slot"""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+        self._free = []
+
+
+class SharedFrameReader:
+    """Maps the pool's slots in a worker and exposes them as frames without copying"""
+
+    def __init__(self):
+        self._blocks = {}  # slot -> SharedMemory
+
+    def frame(self, ref):
+        """Frame backed by the slot's memory, or None if the slot already holds a newer frame"""
+        block = self._blocks.get(ref.slot)
+        if block is None or block.name != ref.name:
+            # First use, or the pool re-created its slots for larger frames
+            if block is not None:
+                block.close()
+            block = self._blocks[ref.slot] = shared_memory.SharedMemory(name=ref.name)
+        if _HEADER.unpack_from(block.buf, 0)[0] != ref.sequence:
+            return None
+        size = ref.width * ref.height * 4
+        return Frame(ref.sequence, ref.timestamp, ref.width, ref.height, block.buf[_HEADER.size:_HEADER.size + size])
+
+    def close(self):
+        """Unmap every slot"""
+        for block in self._blocks.values():
+            block.close()
+        self._blocks = {}
@@ -0,0 +1,76 @@
+"""
+Temporal voting over recent hint readings
+
+Single-frame readings flicker while the hint animates: a letter is misread
+for a frame, or OCR lags behind the slot layout. The stabilizer keeps the
+last N readings of the current layout (length and word gaps) and votes on
+each slot, weighted by confidence. A reading with a new layout is a new hint
+and starts the window over.
+
+Letters are only revealed, never hidden again, so blanks read before a
+letter first appeared do not count against it; blanks and other letters read
+after it do. A letter is accepted once its support leads that opposition by
+a margin, and it is kept while it still leads. A single low-confidence
+misread is therefore never accepted, and later blank readings overturn it.
+A new pattern is reported only when the vote changes, so the matcher and the
+results list are not refreshed for every flicker.
+"""
+from collections import deque
+
+# Lead in summed confidence a letter needs over the readings against it to be accepted
+MIN_MARGIN = 0.5
+
+
+def layout(pattern):
+    """Length and word-gap positions of a pattern"""
+    return len(pattern), tuple(i for i, char in enumerate(pattern) if char == ' ')
+
+
+class ReadingStabilizer:
+    """Confidence-weighted vote over the last few readings of one hint layout"""
+
+    def __init__(self, window=5, margin=MIN_MARGIN):
+        self.readings = deque(maxlen=max(1, window))  # (pattern, confidence), oldest first, one layout
+        self.margin = margin
+        self.voted = None
+
+    def reset(self):
+        """Forget every reading (e.g. when monitoring stops or the hint goes away)"""
+        self.readings.clear()
+        self.voted = None
+
+    def add(self, pattern, confidence=1.0):
+        """
+        Add a reading
+
+        Returns:
+            str: The voted pattern if the vote changed, otherwise None
+        """
+        if self.readings and layout(pattern) != layout(self.readings[-1][0]):
+            self.reset()
+        self.readings.append((pattern, confidence))
+        voted = self.vote()
+        if voted == self.voted:
+            return None
+        self.voted = voted
+        return voted
+
+    def vote(self):
+        """Voted pattern of the current readings (None without readings)"""
+        if not self.readings:
+            return None
+        previous = self.voted
+        slots = []
+        for position in range(len(self.readings[-1][0])):
+            chars = [(pattern[position], confidence) for pattern, confidence in self.readings]
+            winner, best = '_', self.margin
+            for letter in sorted({char for char, _ in chars if char != '_'}):
+                first = next(index for index, (char, _) in enumerate(chars) if char == letter)
+                support = sum(confidence for char, confidence in chars if char == letter)
+                against = sum(confidence for char, confidence in chars[first:] if char != letter)
+                lead = support - against
+                # A letter voted before only has to keep the lead
+                if lead >= best or (lead > 0 and previous and previous[position] == letter):
+                    winner, best = letter, max(lead, best)
+            slots.append(winner)
+        return ''.join(slots)
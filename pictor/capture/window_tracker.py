@@ -0,0 +1,136 @@
+"""
+Background tracking of the selected game window
+
+Enumerating windows is slow, and doing it for every canvas redraw or mouse
+release stalls the Tk loop. The tracker looks the selected window up by title
+once. It then polls that handle's geometry at a low rate on its own thread.
+The window titles are enumerated there as well, on request. The UI and the
+capture engine read the cached rectangle. A capture region anchored to the
+window is re-derived whenever the window moves or is resized.
+"""
+import threading
+
+import pygetwindow as gw
+
+
+class WindowTracker:
+    """Keeps a cached handle and rectangle for one window, refreshed on a background thread"""
+
+    def __init__(self, interval=0.5):
+        self.interval = interval  # seconds between geometry polls
+        self._title = None
+        self._window = None
+        self._rect = None  # (left, top, width, height)
+        self._relative_region = None  # capture region relative to the window's top-left corner
+        self._titles = []
+        self._titles_requested = True
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self.listeners = []  # callables(rect), run on the tracker thread when the rectangle changes
+        self.version = 0  # bumped on every change to the titles or the rectangle
+
+    @property
+    def title(self):
+        return self._title
+
+    @property
+    def rect(self):
+        """Last known (left, top, width, height) of the selected window, or None"""
+        return self._rect
+
+    @property
+    def titles(self):
+        """Window titles from the last enumeration"""
+        return list(self._titles)
+
+    def start(self):
+        """Start polling on a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="window-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling and wait for the thread to exit"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def select(self, title):
+        """Track the window with this title (looked up on the next poll, which happens right away)"""
+        if title == self._title:
+            return
+        self._title = title
+        self._window = None
+        self._rect = None
+        self._relative_region = None
+        self.version += 1
+        self._wake.set()
+
+    def refresh_titles(self):
+        """Ask for the window titles to be enumerated again"""
+        self._titles_requested = True
+        self._wake.set()
+
+    def anchor_region(self, region):
+        """Remember an absolute capture region relative to the tracked window"""
+        if region is None or self._rect is None:
+            self._relative_region = None
+            return
+        left, top = self._rect[0], self._rect[1]
+        self._relative_region = (region[0] - left, region[1] - top, region[2], region[3])
+
+    def absolute_region(self):
+        """Anchored capture region in screen coordinates at the window's current position, or None"""
+        if self._relative_region is None or self._rect is None:
+            return None
+        x, y, width, height = self._relative_region
+        return (self._rect[0] + x, self._rect[1] + y, width, height)
+
+    def _run(self):
+        """Tracker thread: poll the geometry, enumerate titles when asked"""
+        while not self._stop.is_set():
+            if self._titles_requested:
+                self._titles_requested = False
+                try:
+                    self._titles = [title for title in gw.getAllTitles() if title and title.strip()]
+                except Exception as e:
+                    print(f"[DEBUG] Window enumeration failed: {e}")
+                    self._titles = []
+                self.version += 1
+            self._poll()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _poll(self):
+        """Read the cached window's geometry, looking the title up again if the handle went stale"""
+        title = self._title
+        if not title:
+            return
+        rect = None
+        for _ in range(2):
+            if self._window is None:
+                try:
+                    self._window = gw.getWindowsWithTitle(title)[0]
+                except Exception:
+                    break
+            try:
+                window = self._window
+                rect = (window.left, window.top, window.width, window.height)
+                break
+            except Exception:
+                # The window was closed or re-created: find it by title again
+                self._window = None
+        if title != self._title or rect == self._rect:
+            return
+        self._rect = rect
+        self.version += 1
+        for listener in list(self.listeners):
+            try:
+                listener(rect)
+            except Exception as e:
+                print(f"[DEBUG] Window tracker listener failed: {e}")
@@ -3,11 +3,17 @@ from tkinter import messagebox
 import os
 from typing import Optional
 from ...utils.word_filtering import WordFilter  # type: ignore
+from ...utils.answer_history import AnswerHistory  # type: ignore
 from ...settings import SettingsManager  # type: ignore
 from .navigation_bar import NavigationBar
 from .search_input_frame import SearchInputFrame
 from .results_display_frame import ResultsDisplayFrame
 from .wordlist_selector import WordListSelectionWindow
+from .result_prefetcher import ResultPrefetcher
+from ...capture import CaptureEngine, OCRPool, OCRCache, HintShapeTracker, ReadingStabilizer, fits_shape, merge_ocr_text  # type: ignore
+from ...capture.stabilizer import layout  # type: ignore
+from ...capture.ocr_cache import OCR_CACHE_PATH  # type: ignore
+from ...capture.window_tracker import WindowTracker  # type: ignore
 
 
 class WordMatcherWindow:
@@ -31,6 +37,37 @@ class WordMatcherWindow:
         user_words_path = os.path.join(wordlists_folder, editable_file)
         self.word_filter = WordFilter(user_words_file=user_words_path)
 
+        # Confirmed answers per game profile, written in the background and used to rank results
+        self.answer_history = AnswerHistory()
+        self.word_filter.answer_history = self.answer_history
+
+        # Screen capture for hint monitoring (started from the capture settings)
+        self.capture_engine = CaptureEngine()
+        # Geometry of the selected game window, polled in the background; the capture region follows it
+        self.window_tracker = WindowTracker()
+        self.window_tracker.listeners.append(self._on_tracked_window_moved)
+        self.window_tracker.start()
+        # The hint's word shape (slot count, word gaps) is read from every frame, ahead of OCR
+        self.hint_tracker = HintShapeTracker()
+        # Readings of hint images seen before, by perceptual hash (kept across sessions if enabled)
+        ocr_backend = self.settings.get('ocr_backend', 'glyphs')
+        ocr_cache = OCRCache(self.settings.get('ocr_cache_size', 512),
+                             OCR_CACHE_PATH if self.settings.get('ocr_cache_persist', True) else None,
+                             ocr_backend)
+        # Preprocessing of the Tesseract backend: crop inside the region, fixed threshold (None = Otsu), upscaling
+        backend_options = {}
+        if ocr_backend == "tesseract":
+            backend_options = {'crop': self.settings.get('ocr_crop'), 'threshold': self.settings.get('ocr_threshold'),
+                               'scale': self.settings.get('ocr_scale', 2)}
+        self.ocr_pool = OCRPool(ocr_backend, self.settings.get('ocr_workers', 2), backend_options=backend_options,
+                                on_frame=self.hint_tracker.update, cache=ocr_cache)
+        # Readings are voted over a short window so a flickering hint does not re-run the search
+        self.hint_stabilizer = ReadingStabilizer(self.settings.get('ocr_vote_window', 5))
+        self._last_hint_reading = None
+
+        # Speculative results for likely next keystrokes, computed while idle
+        self.prefetcher = ResultPrefetcher(self.root, self.word_filter)
+
         # Frame management
         self.current_frame = None
         self.frames = {}
@@ -57,7 +94,10 @@ class WordMatcherWindow:
             self.show_frame,
             self.on_recent_changes,
             self.on_dev_tools,
-            self.on_open_settings
+            self.on_open_settings,
+            list(self.word_filter.profiles),
+            self.word_filter.active_profile,
+            self.set_profile
         )
 
         self.setup_frames()
@@ -69,7 +109,17 @@ class WordMatcherWindow:
         # Set up keyboard shortcuts
         self.setup_keyboard_shortcuts()
 
+        # Build the other game profiles' indexes while idle so switching is instant
+        self._profiles_to_warm = list(self.word_filter.profiles)
+        self.root.after(500, self._warm_next_profile)
+
+        # Feed captured hint patterns into the search box while monitoring
+        self.root.after(250, self._poll_hint_pattern)
+
     def _on_any_keypress(self, event):
+        # Real input takes priority over speculative prefetching
+        self.prefetcher.cancel()
+
         # Track if Tab or Shift+Tab was pressed
         if event.keysym == 'Tab':
             self._last_key_was_tab = True
@@ -102,6 +152,72 @@ class WordMatcherWindow:
         self.results_display_frame.set_exact_length_match(self.exact_length_match)  # type: ignore
         self.results_display_frame.filter_words(current_pattern)  # type: ignore
 
+    def set_search_mode(self, mode):
+        """Switch the search mode (pattern, contains, fuzzy, anagram, letters) and refresh results"""
+        current_pattern = self.search_input_frame.get_word_entry().get()  # type: ignore
+        self.results_display_frame.set_search_mode(mode)  # type: ignore
+        self.results_display_frame.filter_words(current_pattern)  # type: ignore
+
+    def set_profile(self, name):
+        """Switch the game profile (None for the plain wordlist selection) and refresh results"""
+        if not self.word_filter.activate_profile(name):
+            return
+        profile = self.word_filter.profiles.get(name)
+        self.results_display_frame.set_sort_order(profile.sort_order if profile else "length")  # type: ignore
+        current_pattern = self.search_input_frame.get_word_entry().get()  # type: ignore
+        self.results_display_frame.filter_words(current_pattern)  # type: ignore
+        # After the results list, which may render on idle and set its own status
+        status_text = f"{name or 'All lists'} - {self.word_filter.get_word_count()} words loaded"
+        self.root.after_idle(lambda: self.status_bar.config(text=status_text))  # type: ignore
+
+    def _warm_next_profile(self):
+        """Warm one game profile per idle callback so typing is never blocked for long"""
+        if self._profiles_to_warm:
+            self.word_filter.warm_profile(self._profiles_to_warm.pop(0))
+            self.root.after_idle(self._warm_next_profile)
+
+    def _poll_hint_pattern(self):
+        """Vote on the newest captured hint reading; a changed vote goes into the search box"""
+        latest = self.hint_tracker.latest
+        if not self.ocr_pool.running:
+            self.hint_stabilizer.reset()
+            self._last_hint_reading = None
+        elif latest is not None:
+            sequence, shape = latest
+            reading = self.ocr_pool.latest
+            # Each new shape or OCR reading is voted once, however many ticks it stays the latest
+            key = (sequence, reading.sequence if reading else None)
+            if key != self._last_hint_reading:
+                self._last_hint_reading = key
+                voted = None
+                if shape is None:
+                    # The hint line is gone (e.g. between rounds): the next hint starts a new vote
+                    self.hint_stabilizer.reset()
+                elif reading is not None and reading.sequence >= sequence and fits_shape(shape.pattern, reading.text):
+                    voted = self.hint_stabilizer.add(merge_ocr_text(shape.pattern, reading.text), reading.confidence)
+                elif self.hint_stabilizer.voted is None or layout(self.hint_stabilizer.voted) != layout(shape.pattern):
+                    # A new hint OCR has not read yet: show its layout now, its letters come with the reading
+                    voted = self.hint_stabilizer.add(shape.pattern)
+                if voted is not None:
+                    self.apply_hint_pattern(voted)
+        self.root.after(250, self._poll_hint_pattern)
+
+    def _on_tracked_window_moved(self, rect):
+        """Keep the capture region on the same part of the game window (runs on the tracker thread)"""
+        region = self.window_tracker.absolute_region()
+        if rect is not None and region is not None:
+            self.capture_engine.set_region(region)
+
+    def apply_hint_pattern(self, pattern):
+        """Replace the search text with a hint pattern and match its exact length"""
+        word_entry = self.search_input_frame.get_word_entry()  # type: ignore
+        word_entry.delete(0, tk.END)  # type: ignore
+        word_entry.insert(0, pattern)  # type: ignore
+        if not self.exact_length_match:
+            self.exact_length_match = True
+            self.results_display_frame.set_exact_length_match(True)  # type: ignore
+        self.results_display_frame.filter_words(pattern)  # type: ignore
+
     def open_wordlists_folder(self):
         """Open the wordlists folder in file explorer"""
         import os
@@ -168,13 +284,23 @@ class WordMatcherWindow:
         self.status_bar.pack(side='bottom', fill='x')
 
         # Initialize components
-        self.results_display_frame = ResultsDisplayFrame(main_frame, self.word_filter, self.status_bar, self.exact_length_match)
+        self.results_display_frame = ResultsDisplayFrame(
+            main_frame,
+            self.word_filter,
+            self.status_bar,
+            self.exact_length_match,
+            self.prefetcher
+        )
+        active_profile = self.word_filter.profiles.get(self.word_filter.active_profile)
+        if active_profile:
+            self.results_display_frame.set_sort_order(active_profile.sort_order)
         self.search_input_frame = SearchInputFrame(
             main_frame,
             self.word_filter,
             self.results_display_frame.filter_words,
             self.status_bar,
-            self._flash_entry
+            self._flash_entry,
+            self.set_search_mode
         )
 
         # Update status bar text
@@ -240,6 +366,7 @@ class WordMatcherWindow:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(selected_word)
                 self.status_bar.config(text=f"Copied '{selected_word}' to clipboard")  # type: ignore
+                self._record_answer(selected_word)
             else:
                 if results_listbox.size() > 0:  # type: ignore
                     results_listbox.selection_set(0)  # type: ignore
@@ -266,6 +393,7 @@ class WordMatcherWindow:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(selected_word)
                 self.status_bar.config(text=f"Copied '{selected_word}' to clipboard")  # type: ignore
+                self._record_answer(selected_word)
             else:
                 if results_listbox.size() > 0:  # type: ignore
                     results_listbox.selection_set(0)  # type: ignore
@@ -274,6 +402,7 @@ class WordMatcherWindow:
                     self.root.clipboard_clear()
                     self.root.clipboard_append(selected_word)
                     self.status_bar.config(text=f"Copied '{selected_word}' to clipboard")  # type: ignore
+                    self._record_answer(selected_word)
 
             # Re-bind KeyRelease after a delay, but only if input still exists
             def rebind_if_exists():
@@ -351,8 +480,19 @@ class WordMatcherWindow:
         # Refresh the current search results
         current_pattern = self.search_input_frame.get_word_entry().get()  # type: ignore
         self.results_display_frame.filter_words(current_pattern)  # type: ignore
-        self.status_bar.config(text=f"Wordlists updated - {self.word_filter.get_word_count()} words loaded")  # type: ignore
+        # After the results list, which may render on idle and set its own status
+        status_text = f"Wordlists updated - {self.word_filter.get_word_count()} words loaded"
+        self.root.after_idle(lambda: self.status_bar.config(text=status_text))  # type: ignore
+
+    def _record_answer(self, word):
+        """Remember a confirmed answer for the active game profile (non-blocking)"""
+        self.answer_history.record(self.word_filter.active_profile, word)
 
     def run(self):
         """Start the application"""
-        self.root.mainloop()
\ No newline at end of file
+        self.root.mainloop()
+        self.window_tracker.stop()
+        self.capture_engine.stop()
+        self.ocr_pool.stop()
+        # Flush answers still queued for the history database
+        self.answer_history.close()
\ No newline at end of file
@@ -1,16 +1,24 @@
 import tkinter as tk
+from tkinter import ttk
 from typing import Optional
 
+# Profile dropdown entry for the plain wordlist selection
+NO_PROFILE_LABEL = "All lists"
+
 
 class NavigationBar:
     """Navigation bar component for the main window"""
 
-    def __init__(self, parent, show_frame_callback, on_recent_changes, on_dev_tools, on_open_settings):
+    def __init__(self, parent, show_frame_callback, on_recent_changes, on_dev_tools, on_open_settings,
+                 profile_names=None, active_profile=None, on_profile_selected=None):
         self.parent = parent
         self.show_frame_callback = show_frame_callback
         self.on_recent_changes = on_recent_changes
         self.on_dev_tools = on_dev_tools
         self.on_open_settings = on_open_settings
+        self.profile_names = list(profile_names or [])
+        self.on_profile_selected = on_profile_selected
+        self.profile_var = tk.StringVar(value=active_profile or NO_PROFILE_LABEL)
 
         self.nav_frame: Optional[tk.Frame] = None
         self.main_nav_btn: Optional[tk.Button] = None
@@ -80,6 +88,23 @@ class NavigationBar:
         )
         self.settings_btn.pack(side='right', padx=5)
 
+        # Game profile dropdown
+        if self.on_profile_selected:
+            profile_dropdown = ttk.Combobox(
+                right_nav_frame,
+                textvariable=self.profile_var,
+                values=[NO_PROFILE_LABEL] + self.profile_names,
+                state='readonly',
+                width=14
+            )
+            profile_dropdown.pack(side='right', padx=5)
+            profile_dropdown.bind('<<ComboboxSelected>>', self.on_profile_changed)
+
+    def on_profile_changed(self, event=None):
+        """Handle game profile dropdown changes"""
+        name = self.profile_var.get()
+        self.on_profile_selected(None if name == NO_PROFILE_LABEL else name)
+
     def update_nav_buttons(self, active_frame):
         """Update navigation button visual states"""
         # Only 'main' frame has a navigation button now
@@ -0,0 +1,133 @@
+import sys
+import time
+from collections import OrderedDict
+
+
+class ResultPrefetcher:
+    """Precomputes results for likely next patterns while the Tk event loop is idle"""
+
+    # Candidates inspected when predicting the next letters
+    SAMPLE_SIZE = 5000
+
+    def __init__(self, root, word_filter, memory_budget=4 * 1024 * 1024, slice_ms=8.0, keystroke_budget_ms=150.0):
+        self.root = root
+        self.word_filter = word_filter
+        self.memory_budget = memory_budget  # bytes of cached result lists
+        self.slice_ms = slice_ms  # longest single idle callback
+        self.keystroke_budget_ms = keystroke_budget_ms  # total work per keystroke
+
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._index_version = word_filter.index_version
+        self._queue = []
+        self._pending = None  # (pattern, exact_length, matches) still to be turned into queries
+        self._job = None
+        self._spent_ms = 0.0
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern, exact_length, mode="pattern"):
+        """Get prefetched results for a query, or None if it was not prefetched"""
+        self._check_index_version()
+        key = (self.word_filter.normalize(pattern), exact_length, mode)
+        matches = self._cache.get(key)
+        if matches is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return matches
+
+    def schedule(self, pattern, exact_length, mode, matches):
+        """Queue likely follow-up queries of the pattern that was just answered"""
+        self.cancel()
+        if mode != "pattern" or not pattern:
+            return
+        self._check_index_version()
+        # Predicting folds a sample of the matches, so it runs in the first idle slice too
+        self._pending = (pattern, exact_length, matches)
+        self._spent_ms = 0.0
+        self._job = self.root.after_idle(self._run_slice)
+
+    def cancel(self):
+        """Stop prefetching (called as soon as real input arrives)"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self._queue = []
+        self._pending = None
+
+    def clear(self):
+        """Drop every cached result"""
+        self.cancel()
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def _check_index_version(self):
+        """Invalidate the cache when the word filter rebuilt its indexes"""
+        if self._index_version != self.word_filter.index_version:
+            self.clear()
+            self._index_version = self.word_filter.index_version
+
+    def _predict(self, pattern, exact_length, matches):
+        """List (pattern, exact_length) queries likely to follow, most likely first"""
+        sample = [self.word_filter.normalize(word) for word in matches[:self.SAMPLE_SIZE]]
+        predictions = [(pattern, not exact_length)]
+
+        # Each plausible letter at the next blank
+        blank = pattern.find('_')
+        if blank >= 0:
+            for letter in self._letters_at(sample, blank):
+                predictions.append((pattern[:blank] + letter + pattern[blank + 1:], exact_length))
+
+        # One more trailing character
+        for letter in self._letters_at(sample, len(pattern)):
+            predictions.append((pattern + letter, exact_length))
+        predictions.append((pattern + '_', exact_length))
+
+        return [query for query in predictions if (query[0], query[1], "pattern") not in self._cache]
+
+    @staticmethod
+    def _letters_at(words, position):
+        """Get the letters found at position among words, most frequent first"""
+        counts = {}
+        for word in words:
+            if len(word) > position:
+                counts[word[position]] = counts.get(word[position], 0) + 1
+        return sorted(counts, key=counts.get, reverse=True)
+
+    def _run_slice(self):
+        """Answer queued queries until the slice or keystroke CPU budget runs out"""
+        self._job = None
+        start = time.perf_counter()
+        if self._pending is not None:
+            pattern, exact_length, matches = self._pending
+            self._pending = None
+            self._queue = self._predict(self.word_filter.normalize(pattern), exact_length, matches)
+        while self._queue:
+            elapsed = (time.perf_counter() - start) * 1000
+            if elapsed >= self.slice_ms or self._spent_ms + elapsed >= self.keystroke_budget_ms:
+                break
+            pattern, exact_length = self._queue.pop(0)
+            key = (pattern, exact_length, "pattern")
+            if key not in self._cache:
+                self._store(key, self.word_filter.filter_words(pattern, exact_length=exact_length))
+
+        self._spent_ms += (time.perf_counter() - start) * 1000
+        if self._queue and self._spent_ms < self.keystroke_budget_ms:
+            # Re-queue so pending key events are handled before the next slice
+            self._job = self.root.after_idle(self._run_slice)
+        else:
+            self._queue = []
+
+    def _store(self, key, matches):
+        """Cache a result, evicting least recently used entries to stay within the memory budget"""
+        size = sys.getsizeof(matches)
+        if size > self.memory_budget:
+            return
+        self._cache[key] = matches
+        self._cache_bytes += size
+        while self._cache_bytes > self.memory_budget:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= sys.getsizeof(evicted)
@@ -1,17 +1,32 @@
 import tkinter as tk
+from tkinter import ttk
 from typing import Optional
 
+# Result ordering labels shown in the sort dropdown
+SORT_ORDER_LABELS = {
+    "By length": "length",
+    "By likelihood": "likelihood",
+}
+
 
 class ResultsDisplayFrame:
     """Results display frame component"""
 
-    def __init__(self, parent, word_filter, status_bar, exact_length_match=False):
+    def __init__(self, parent, word_filter, status_bar, exact_length_match=False, prefetcher=None):
         self.parent = parent
         self.word_filter = word_filter
         self.status_bar = status_bar
         self.exact_length_match = exact_length_match
+        self.search_mode = "pattern"
+        self.sort_order = "length"
+        self.prefetcher = prefetcher
+        self.last_pattern = ""
+        self._render_job = None  # pending after_idle rendering of the results list
+        self._suggestions_job = None  # pending after_idle ranking of the best reveals
+        self.sort_var = tk.StringVar(value="By length")
 
         self.results_listbox: Optional[tk.Listbox] = None
+        self.suggestions_label: Optional[tk.Label] = None
         self.setup_results_frame()
 
     def setup_results_frame(self):
@@ -36,8 +51,51 @@ class ResultsDisplayFrame:
         self.results_listbox.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
+        info_frame = tk.Frame(results_frame, bg='#f0f0f0')
+        info_frame.pack(fill='x')
+
+        # Result ordering
+        sort_dropdown = ttk.Combobox(
+            info_frame,
+            textvariable=self.sort_var,
+            values=list(SORT_ORDER_LABELS),
+            state='readonly',
+            width=12
+        )
+        sort_dropdown.pack(side='right', pady=(2, 0))
+        sort_dropdown.bind('<<ComboboxSelected>>', self.on_sort_order_changed)
+
+        # Best letters to reveal for the current candidates
+        self.suggestions_label = tk.Label(
+            info_frame,
+            text="",
+            anchor='w',
+            bg='#f0f0f0',
+            fg='#666666',
+            font=('Arial', 9)
+        )
+        self.suggestions_label.pack(side='left', fill='x', expand=True)
+
     def filter_words(self, pattern):
-        """Filter word list based on pattern and sort results by length (shortest to longest)"""
+        """Filter word list based on pattern and sort results by length (shortest to longest) or likelihood"""
+        self.last_pattern = pattern
+        if self._render_job is not None:
+            self.results_listbox.after_cancel(self._render_job)  # type: ignore
+            self._render_job = None
+        if self._suggestions_job is not None:
+            self.results_listbox.after_cancel(self._suggestions_job)  # type: ignore
+            self._suggestions_job = None
+        if pattern and self.search_mode == "pattern":
+            # Pattern counts come from index cardinalities: show the count now and build the
+            # list once Tk has repainted (a newer keystroke cancels the pending list)
+            self.update_count(pattern)
+            self._render_job = self.results_listbox.after_idle(self._render_results, pattern)  # type: ignore
+        else:
+            self._render_results(pattern)
+
+    def _render_results(self, pattern):
+        """Find, sort and show the matches for pattern"""
+        self._render_job = None
         # Remember the currently selected word before clearing
         selected_word = None
         selection = self.results_listbox.curselection()  # type: ignore
@@ -49,16 +107,24 @@ class ResultsDisplayFrame:
         # Determine matches: prefix or wildcard search, or show all if empty
         mode_text = ""
         if pattern:
-            matches = self.word_filter.filter_words(pattern, exact_length=self.exact_length_match)
-            mode_text = " (exact length)" if self.exact_length_match else ""
+            matches = self.prefetcher.get(pattern, self.exact_length_match, self.search_mode) if self.prefetcher else None
+            if matches is None:
+                matches = self.word_filter.filter_words(pattern, exact_length=self.exact_length_match, mode=self.search_mode)
+            mode_text = self._get_mode_text()
             status_text = f"Selected 1 of {len(matches)} items{mode_text}" if matches else f"No matches found{mode_text}"
         else:
             # Show all loaded words when no pattern entered
             matches = self.word_filter.get_combined_wordlist()
             status_text = f"Showing all {len(matches)} words loaded"
 
-        # Sort matches by length (shortest to longest), then alphabetically for ties
-        matches = sorted(matches, key=lambda w: (len(w), w.lower()))
+        # Sort matches by length (shortest to longest), then alphabetically for ties,
+        # or most likely first; fuzzy results are already ranked by edit distance
+        if pattern and self.search_mode == "fuzzy":
+            pass
+        elif self.sort_order == "likelihood":
+            matches = self.word_filter.rank_by_likelihood(matches)
+        else:
+            matches = self.word_filter.rank_by_length(matches)
 
         # Populate results
         for word in matches:
@@ -74,8 +140,59 @@ class ResultsDisplayFrame:
             self.results_listbox.selection_set(0)  # type: ignore
             self.results_listbox.see(0)  # type: ignore
 
+        self.status_bar.config(text=status_text)
+        # Ranking reveals queries the candidates again: do it once Tk is idle (a newer search cancels it)
+        self._suggestions_job = self.results_listbox.after_idle(self.update_suggestions, pattern, len(matches))  # type: ignore
+
+        # Precompute likely next queries once the UI is idle
+        if self.prefetcher and pattern:
+            self.prefetcher.schedule(pattern, self.exact_length_match, self.search_mode, matches)
+
+    def update_count(self, pattern):
+        """Show the match count for pattern in the status bar without rendering results"""
+        count = self.word_filter.count(pattern, exact_length=self.exact_length_match, mode=self.search_mode)
+        mode_text = self._get_mode_text()
+        status_text = f"Selected 1 of {count} items{mode_text}" if count else f"No matches found{mode_text}"
+        self.status_bar.config(text=status_text)
+
+    def update_suggestions(self, pattern, match_count):
+        """Show the most informative letters to reveal under the results list"""
+        self._suggestions_job = None
+        text = ""
+        if pattern and '_' in pattern and self.search_mode == "pattern" and match_count > 1:
+            parts = []
+            for suggestion in self.word_filter.suggest_reveals(pattern, self.exact_length_match, limit=3):
+                if suggestion['kind'] == 'letter':
+                    parts.append(f"'{suggestion['letter']}' at {suggestion['position'] + 1} ({suggestion['gain']:.2f} bits)")
+                else:
+                    parts.append(f"guess '{suggestion['word']}' ({suggestion['gain']:.2f} bits)")
+            if parts:
+                text = "Best reveals: " + ", ".join(parts)
+        self.suggestions_label.config(text=text)  # type: ignore
+
+    def set_sort_order(self, order):
+        """Set the result ordering (length or likelihood) without refreshing"""
+        for label, value in SORT_ORDER_LABELS.items():
+            if value == order:
+                self.sort_var.set(label)
+                self.sort_order = order
+
+    def on_sort_order_changed(self, event=None):
+        """Re-sort the current results when the ordering changes"""
+        self.sort_order = SORT_ORDER_LABELS.get(self.sort_var.get(), "length")
+        self.filter_words(self.last_pattern)
+
     def get_results_listbox(self):
         return self.results_listbox
 
+    def _get_mode_text(self):
+        """Describe the active search options for the status bar"""
+        if self.search_mode != "pattern":
+            return f" ({self.search_mode})"
+        return " (exact length)" if self.exact_length_match else ""
+
     def set_exact_length_match(self, value):
-        self.exact_length_match = value
\ No newline at end of file
+        self.exact_length_match = value
+
+    def set_search_mode(self, value):
+        self.search_mode = value
\ No newline at end of file
@@ -1,17 +1,31 @@
 import tkinter as tk
+from tkinter import ttk
 from typing import Optional
 
+# Search mode labels shown in the mode dropdown, mapped to WordFilter modes
+SEARCH_MODE_LABELS = {
+    "Pattern": "pattern",
+    "Contains": "contains",
+    "Fuzzy": "fuzzy",
+    "Anagram": "anagram",
+    "Letters": "letters",
+}
+
 
 class SearchInputFrame:
     """Search input frame component"""
 
-    def __init__(self, parent, word_filter, filter_words_callback, status_bar, flash_entry_callback):
+    def __init__(self, parent, word_filter, filter_words_callback, status_bar, flash_entry_callback,
+                 search_mode_callback=None):
         self.parent = parent
         self.word_filter = word_filter
         self.filter_words_callback = filter_words_callback
         self.status_bar = status_bar
         self.flash_entry_callback = flash_entry_callback
+        self.search_mode_callback = search_mode_callback
 
+        self.mode_var = tk.StringVar(value="Pattern")
+        self.mode_dropdown: Optional[ttk.Combobox] = None
         self.word_entry: Optional[tk.Entry] = None
         self.length_label: Optional[tk.Label] = None
         self.plus_btn: Optional[tk.Button] = None
@@ -35,6 +49,17 @@ class SearchInputFrame:
         word_input_frame = tk.Frame(input_frame, bg='#f0f0f0')
         word_input_frame.pack(side='right')
 
+        # Search mode selector
+        self.mode_dropdown = ttk.Combobox(
+            word_input_frame,
+            textvariable=self.mode_var,
+            values=list(SEARCH_MODE_LABELS),
+            state='readonly',
+            width=8
+        )
+        self.mode_dropdown.pack(side='left', padx=(0, 4))
+        self.mode_dropdown.bind('<<ComboboxSelected>>', self.on_mode_changed)
+
         self.word_entry = tk.Entry(
             word_input_frame,
             font=('Arial', 12),
@@ -105,13 +130,22 @@ class SearchInputFrame:
         self.length_label.config(text=", ".join(word_lengths))  # type: ignore
         self.filter_words_callback(word)
 
+    def on_mode_changed(self, event=None):
+        """Handle search mode changes and refresh results"""
+        mode = SEARCH_MODE_LABELS.get(self.mode_var.get(), "pattern")
+        if self.search_mode_callback:
+            self.search_mode_callback(mode)
+        self.word_entry.focus_set()  # type: ignore
+
     def on_length_plus(self):
         """Add current word to user wordlist"""
         word = self.word_entry.get().strip()  # type: ignore
         if word:
             if self.word_filter.add_user_word(word):
-                self.status_bar.config(text=f"Added '{word}' to wordlist")
                 self.filter_words_callback(word)  # Refresh results
+                # After the results list, which may render on idle and set its own status
+                status_text = f"Added '{word}' to wordlist"
+                self.status_bar.after_idle(lambda: self.status_bar.config(text=status_text))
                 self.flash_entry_callback("green")
             else:
                 self.status_bar.config(text=f"'{word}' already exists in wordlist")
@@ -122,8 +156,10 @@ class SearchInputFrame:
         word = self.word_entry.get().strip()  # type: ignore
         if word:
             if self.word_filter.remove_user_word(word):
-                self.status_bar.config(text=f"Removed '{word}' from wordlist")
                 self.filter_words_callback(word)  # Refresh results
+                # After the results list, which may render on idle and set its own status
+                status_text = f"Removed '{word}' from wordlist"
+                self.status_bar.after_idle(lambda: self.status_bar.config(text=status_text))
                 self.flash_entry_callback("orange")
             else:
                 self.status_bar.config(text=f"'{word}' not found in user wordlist")
@@ -3,17 +3,20 @@ Capture Settings Panel for Pictor Settings Window
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pygetwindow as gw
 
 class CaptureSettingsPanel(tk.Frame):
     """A frame that contains the capture settings controls."""
     def __init__(self, parent, app, **kwargs):
         super().__init__(parent, bg='#f0f0f0', **kwargs)
         self.app = app
-        
-        # State variables
-        self.monitoring = False
-        self.coordinates = None
+        self.engine = app.capture_engine
+        self.ocr_pool = app.ocr_pool
+        self.tracker = app.window_tracker
+        self._tracker_version = None
+        
+        # State variables (the engine outlives the panel, so resume from its state)
+        self.monitoring = self.engine.running
+        self.coordinates = self.engine.region
         self.selection_history = []
         self.history_index = -1
         self._canvas_info = {}
@@ -22,7 +25,10 @@ class CaptureSettingsPanel(tk.Frame):
         # UI state variables
         self.window_var = tk.StringVar()
         self.priority_var = tk.StringVar(value="Match title")
-        self.rate_var = tk.DoubleVar(value=1.0)
+        self.rate_var = tk.DoubleVar(value=self.engine.fps)
+        self.rate_var.trace_add('write', self.on_rate_changed)
+        self.threshold_var = tk.DoubleVar(value=self.engine.change_detector.threshold * 100)
+        self.threshold_var.trace_add('write', self.on_threshold_changed)
         
         # Widget references
         self.window_dropdown = None
@@ -32,8 +38,14 @@ class CaptureSettingsPanel(tk.Frame):
         self.preview_canvas = None
         self.refresh_btn = None
         self.rate_scale = None
+        self.capture_stats_label = None
+        self.ocr_stats_label = None
 
         self.build_ui()
+        if self.monitoring:
+            self.monitor_btn.config(text="Stop Monitoring", bg='#f44336')
+            self.poll_capture_stats()
+        self.poll_window_tracker()
 
     def build_ui(self):
         """Create the capture settings UI."""
@@ -148,12 +160,34 @@ class CaptureSettingsPanel(tk.Frame):
         ).pack(side='left')
         self.coords_label = tk.Label(
             coords_frame,
-            text="None",
+            text=f"{self.coordinates}" if self.coordinates else "None",
             bg='#f0f0f0',
             font=('Arial', 9, 'bold')
         )
         self.coords_label.pack(side='left', padx=5)
         
+        # Achieved capture rate and dropped frames while monitoring
+        self.capture_stats_label = tk.Label(
+            coords_frame,
+            text="Capture idle",
+            bg='#f0f0f0',
+            fg='#666666',
+            font=('Arial', 9)
+        )
+        self.capture_stats_label.pack(side='right')
+        
+        # OCR throughput, latency and latest reading while monitoring
+        ocr_frame = tk.Frame(self, bg='#f0f0f0')
+        ocr_frame.pack(fill='x', padx=10)
+        self.ocr_stats_label = tk.Label(
+            ocr_frame,
+            text="OCR idle",
+            bg='#f0f0f0',
+            fg='#666666',
+            font=('Arial', 9)
+        )
+        self.ocr_stats_label.pack(side='right')
+        
         # Bottom controls
         bottom_frame = tk.Frame(self, bg='#f0f0f0')
         bottom_frame.pack(fill='x', padx=10, pady=5)
@@ -210,25 +244,87 @@ class CaptureSettingsPanel(tk.Frame):
             font=('Arial', 9)
         ).pack(side='left')
         
-        # Populate window list and bind selection event
+        # Change detection: frames differing in fewer sampled pixels than this skip OCR
+        threshold_frame = tk.Frame(self, bg='#f0f0f0')
+        threshold_frame.pack(fill='x', padx=10, pady=(0, 5))
+        
+        tk.Label(
+            threshold_frame,
+            text="Change Threshold:",
+            bg='#f0f0f0',
+            font=('Arial', 9)
+        ).pack(side='left')
+        
+        tk.Scale(
+            threshold_frame,
+            variable=self.threshold_var,
+            from_=0.0,
+            to=5.0,
+            resolution=0.1,
+            orient='horizontal',
+            length=100,
+            bg='#f0f0f0'
+        ).pack(side='left', padx=5)
+        
+        tk.Label(
+            threshold_frame,
+            text="% of pixels",
+            bg='#f0f0f0',
+            font=('Arial', 9)
+        ).pack(side='left')
+        
+        # Populate window list (from the tracker's last enumeration) and bind selection event
         self.populate_windows()
-        self.window_dropdown.bind('<<ComboboxSelected>>', lambda e: (
-            self.print_selected_window_dims(), 
-            self.preview_canvas.event_generate('<Configure>') if self.preview_canvas else None,
-            print("[DEBUG] Window selection changed - redrawing preview")
-        ))
+        self.window_dropdown.bind('<<ComboboxSelected>>', self.on_window_selected)
+
+    def on_window_selected(self, event=None):
+        """Track the newly selected window; the preview redraws once its geometry is known"""
+        title = self.window_var.get()
+        self.tracker.select(title if title != "No sources detected" else None)
+        self.draw_placeholder()
 
     def on_refresh_windows(self):
-        """Refresh the window list"""
-        self.populate_windows()
-        self.print_selected_window_dims()
-        if self.preview_canvas:
-            self.preview_canvas.event_generate('<Configure>')
-        
+        """Refresh the window list (enumerated on the tracker thread, shown when it arrives)"""
+        self.tracker.refresh_titles()
+
+    def poll_window_tracker(self):
+        """Pick up new window titles and geometry from the tracker's cache"""
+        if not self.winfo_exists():
+            return
+        if self.tracker.version != self._tracker_version:
+            self._tracker_version = self.tracker.version
+            if self.window_dropdown and tuple(self._filter_titles(self.tracker.titles)) != tuple(self.window_dropdown['values']):
+                self.populate_windows()
+            # Follow the window if it moved or was resized
+            region = self.tracker.absolute_region()
+            if region is not None and region != self.coordinates:
+                self.coordinates = region
+                if self.coords_label:
+                    self.coords_label.config(text=f"{region}")
+            self.print_selected_window_dims()
+            self.draw_placeholder()
+        self.after(250, self.poll_window_tracker)
+
     def populate_windows(self):
-        """Populate the window dropdown with all open window titles"""
+        """Populate the window dropdown with the open window titles, keeping the tracked window selected"""
+        unique_windows = self._filter_titles(self.tracker.titles)
+        if not unique_windows:
+            unique_windows = ["No sources detected"]
+        
+        if self.window_dropdown:
+            self.window_dropdown['values'] = unique_windows
+            if unique_windows[0] == "No sources detected":
+                self.window_dropdown.set("No sources detected")
+            elif self.tracker.title in unique_windows:
+                self.window_dropdown.set(self.tracker.title)
+            else:
+                self.window_dropdown.set(unique_windows[0])
+                self.on_window_selected()
+
+    @staticmethod
+    def _filter_titles(all_titles):
+        """Game and non-tool window titles, without duplicates"""
         try:
-            all_titles = gw.getAllTitles()
             filtered = [w for w in all_titles if w and w.strip()]
             game_keywords = ['skribbl', 'draw', 'pictionary', 'quickdraw']
             browser_terms = ['chrome', 'firefox', 'edge']
@@ -248,36 +344,84 @@ class CaptureSettingsPanel(tk.Frame):
                 windows.append(w)
             
             seen = set()
-            unique_windows = [x for x in windows if not (x in seen or seen.add(x))]
+            return [x for x in windows if not (x in seen or seen.add(x))]
         except Exception:
-            unique_windows = []
-        
-        if not unique_windows:
-            unique_windows = ["No sources detected"]
-        
-        if self.window_dropdown:
-            self.window_dropdown['values'] = unique_windows
-            if unique_windows and unique_windows[0] != "No sources detected":
-                self.window_dropdown.set(unique_windows[0])
-                self.print_selected_window_dims()
-            else:
-                self.window_dropdown.set("No sources detected")
+            return []
             
     def on_toggle_monitoring(self):
-        """Toggle monitoring state"""
+        """Start or stop the capture engine"""
+        if not self.monitoring and not self.coordinates:
+            messagebox.showwarning("Monitoring", "Select a capture area first")
+            return
         self.monitoring = not self.monitoring
         
         if self.monitoring:
+            self.engine.set_region(self.coordinates)
+            self.engine.set_fps(self.rate_var.get())
+            self.engine.start()
+            self.app.hint_tracker.reset()
+            self.ocr_pool.start(self.engine.ring)
+            self.poll_capture_stats()
             if self.select_mode:
                 self.select_mode = False
                 if self.select_area_btn: self.select_area_btn.config(text="Enable Selection Mode", bg=self.cget('bg'), fg="black")
                 if self.preview_canvas: self.preview_canvas.config(cursor="")
             
             if self.monitor_btn: self.monitor_btn.config(text="Stop Monitoring", bg='#f44336')
-            messagebox.showinfo("Monitoring", f"Monitoring started at {self.rate_var.get():.1f} FPS")
         else:
+            self.engine.stop()
+            self.ocr_pool.stop()
+            self.app.hint_tracker.reset()
+            if self.monitor_btn: self.monitor_btn.config(text="Start Monitoring", bg='#4CAF50')
+    
+    def on_threshold_changed(self, *args):
+        """Apply the change-detection threshold (percent of sampled pixels) immediately"""
+        try:
+            self.engine.change_detector.threshold = self.threshold_var.get() / 100
+        except tk.TclError:
+            pass
+    
+    def on_rate_changed(self, *args):
+        """Apply capture rate changes immediately"""
+        try:
+            self.engine.set_fps(self.rate_var.get())
+        except tk.TclError:
+            pass
+    
+    def poll_capture_stats(self):
+        """Show the engine statistics; re-polls from the Tk loop while monitoring"""
+        if not self.winfo_exists() or not self.capture_stats_label:
+            return
+        stats = self.engine.stats()
+        if stats['error']:
+            text = f"Capture error: {stats['error']}"
+        elif stats['running']:
+            text = (f"{stats['fps']:.1f}/{stats['target_fps']:.1f} FPS, {stats['dropped']} dropped, "
+                    f"{stats['skip_ratio']:.0%} unchanged")
+        else:
+            text = "Capture idle"
+        self.capture_stats_label.config(text=text)
+        
+        ocr = self.ocr_pool.stats()
+        if ocr['error']:
+            text = f"OCR error: {ocr['error']}"
+        elif ocr['running']:
+            text = f"OCR {ocr['throughput']:.1f} frames/s, p95 {ocr['p95_ms']:.0f} ms, {ocr['stale']} stale"
+            if ocr['cache_hit_rate'] is not None:
+                text += f", {ocr['cache_hit_rate']:.0%} cached"
+            if ocr['text'] is not None:
+                text += f" - '{ocr['text']}'"
+        else:
+            text = "OCR idle"
+        if self.ocr_stats_label:
+            self.ocr_stats_label.config(text=text)
+        if stats['running']:
+            self.after(500, self.poll_capture_stats)
+        elif self.monitoring:
+            # The capture thread stopped on its own (e.g. an error)
+            self.monitoring = False
+            self.ocr_pool.stop()
             if self.monitor_btn: self.monitor_btn.config(text="Start Monitoring", bg='#4CAF50')
-            messagebox.showinfo("Monitoring", "Monitoring stopped")
     
     def on_select_area(self):
         """Toggle interactive selection mode on/off"""
@@ -286,6 +430,8 @@ class CaptureSettingsPanel(tk.Frame):
         if self.select_mode:
             if self.monitoring:
                 self.monitoring = False
+                self.engine.stop()
+                self.ocr_pool.stop()
                 if self.monitor_btn: self.monitor_btn.config(text="Start Monitoring", bg='#4CAF50')
                 
             if self.select_area_btn: self.select_area_btn.config(text="Disable Selection Mode", bg='orange', fg="white")
@@ -303,11 +449,12 @@ class CaptureSettingsPanel(tk.Frame):
         if not title or title == "No sources detected":
             return
             
-        try:
-            win = gw.getWindowsWithTitle(title)[0]
-            print(f"[DEBUG] Selected window '{title}' dims: left={win.left}, top={win.top}, width={win.width}, height={win.height}")
-        except Exception as e:
-            print(f"[DEBUG] Failed to get dims for '{title}': {e}")
+        rect = self.tracker.rect
+        if rect is None:
+            print(f"[DEBUG] No dims yet for '{title}'")
+            return
+        left, top, width, height = rect
+        print(f"[DEBUG] Selected window '{title}' dims: left={left}, top={top}, width={width}, height={height}")
             
     def draw_placeholder(self, event=None):
         """Draw a proportional representation of the selected window."""
@@ -319,12 +466,11 @@ class CaptureSettingsPanel(tk.Frame):
         
         if not title or title == "No sources detected": return
             
-        try:
-            win = gw.getWindowsWithTitle(title)[0]
-            ww, wh = win.width, win.height
-            left, top = win.left, win.top
-        except Exception:
+        # Geometry comes from the tracker's cache; no window lookup per redraw
+        rect = self.tracker.rect
+        if rect is None or title != self.tracker.title:
             return
+        left, top, ww, wh = rect
 
         cw, ch = canvas.winfo_width(), canvas.winfo_height()
         margin = 20
@@ -424,11 +570,14 @@ class CaptureSettingsPanel(tk.Frame):
         real_h = int(ch / scale)
         
         try:
-            win = gw.getWindowsWithTitle(self.window_var.get())[0]
-            abs_x = win.left + real_x
-            abs_y = win.top + real_y
+            rect = self.tracker.rect
+            abs_x = rect[0] + real_x
+            abs_y = rect[1] + real_y
             self.coordinates = (abs_x, abs_y, real_w, real_h)
             
+            # The tracker moves the region along with the window from now on
+            self.tracker.anchor_region(self.coordinates)
+            self.engine.set_region(self.coordinates)
             self.selection_history.append(self.coordinates)
             self.history_index = len(self.selection_history) - 1
             
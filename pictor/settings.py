@@ -12,6 +12,14 @@ DEFAULT_SETTINGS = {
     "editable_wordlist": "user_added_words.txt",
     "theme": "light",
     "keyboard_shortcuts": {},
+    "ocr_backend": "glyphs",
+    "ocr_workers": 2,
+    "ocr_cache_size": 512,
+    "ocr_cache_persist": True,
+    "ocr_vote_window": 5,
+    "ocr_crop": None,
+    "ocr_threshold": None,
+    "ocr_scale": 2,
 }
 
 class SettingsManager:
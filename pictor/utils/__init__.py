@@ -1,4 +1,11 @@
 # Utility functions
 from .word_filtering import WordFilter
+from .ngram_index import NGramIndex
+from .word_indexes import PositionalIndex, AffixIndex
+from .query_planner import QueryPlanner
+from .fuzzy_matching import FuzzyIndex
+from .anagram_index import AnagramIndex
+from .normalization import fold
+from .game_profiles import GameProfile
 
-__all__ = ['WordFilter']
+__all__ = ['WordFilter', 'NGramIndex', 'PositionalIndex', 'AffixIndex', 'QueryPlanner', 'FuzzyIndex', 'AnagramIndex', 'fold', 'GameProfile']
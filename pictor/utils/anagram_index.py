@@ -0,0 +1,73 @@
+"""
+Letter-multiset index for scrambled-letter hints
+"""
+
+
+class AnagramIndex:
+    """
+    Indexes words by their sorted-letter signature and by letter counts
+
+    Spaces are ignored, so multi-word answers match scrambles of their letters.
+    """
+
+    def __init__(self, words=None):
+        self.signatures = {}
+        self.letter_counts = {}
+        self.size_buckets = {}
+        if words:
+            self.build(words)
+
+    @staticmethod
+    def letters(text):
+        """Get the letters of text that take part in anagram matching"""
+        return text.lower().replace(' ', '')
+
+    @classmethod
+    def signature(cls, text):
+        """Get the sorted-letter signature of text"""
+        return ''.join(sorted(cls.letters(text)))
+
+    def build(self, words):
+        """Rebuild the index for a list of words (word id = position in the list)"""
+        self.signatures = {}
+        self.letter_counts = {}
+        self.size_buckets = {}
+        for word_id, word in enumerate(words):
+            letters = self.letters(word)
+            self.signatures.setdefault(''.join(sorted(letters)), set()).add(word_id)
+            self.size_buckets.setdefault(len(letters), set()).add(word_id)
+
+            # (letter, k) posts every word with at least k copies of letter
+            counts = {}
+            for char in letters:
+                counts[char] = counts.get(char, 0) + 1
+                self.letter_counts.setdefault((char, counts[char]), set()).add(word_id)
+
+    def anagrams(self, letters):
+        """
+        Get ids of words made of exactly these letters
+
+        Underscores stand for unknown letters, so "pl_ap" finds "apple".
+        """
+        letters = self.letters(letters)
+        if '_' not in letters:
+            return set(self.signatures.get(''.join(sorted(letters)), ()))
+        known = letters.replace('_', '')
+        return self.containing(known) & self.size_buckets.get(len(letters), set())
+
+    def containing(self, letters):
+        """Get ids of words containing at least these letters (with multiplicity)"""
+        counts = {}
+        for char in self.letters(letters).replace('_', ''):
+            counts[char] = counts.get(char, 0) + 1
+        if not counts:
+            return set().union(*self.size_buckets.values())
+
+        # Intersect smallest postings first so the working set shrinks quickly
+        postings = sorted((self.letter_counts.get(key, set()) for key in counts.items()), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return candidates
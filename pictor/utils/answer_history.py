@@ -0,0 +1,119 @@
+"""
+Local SQLite history of confirmed answers, per game profile
+
+Writes go through a queue to one background thread that owns the connection.
+Each write is followed by a fresh in-memory snapshot of precomputed boosts.
+Result ordering only reads that snapshot, so the keystroke path never touches
+the database.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+ANSWER_HISTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "data", "answer_history.db")
+# Days after which an answer's boost has halved
+HALF_LIFE_DAYS = 30.0
+# Profile key used for the plain wordlist selection
+NO_PROFILE = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    profile TEXT NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (profile, word)
+)
+"""
+_UPSERT = """
+INSERT INTO answers (profile, word, count, first_seen, last_seen) VALUES (?, ?, 1, ?, ?)
+ON CONFLICT (profile, word) DO UPDATE SET count = count + 1, last_seen = excluded.last_seen
+"""
+
+
+def answer_boost(count, last_seen, now):
+    """Score a seen answer: more sightings rank higher, decaying with time since the last one"""
+    age_days = max(0.0, now - last_seen) / 86400.0
+    return count * 0.5 ** (age_days / HALF_LIFE_DAYS)
+
+
+class AnswerHistory:
+    """Records confirmed answers asynchronously and serves boosts from memory"""
+
+    def __init__(self, path=ANSWER_HISTORY_PATH):
+        self.path = path
+        self._snapshots = {}  # profile -> {word: boost}, replaced wholesale by the writer
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="answer-history", daemon=True)
+        self._thread.start()
+
+    def record(self, profile, word):
+        """Queue a confirmed answer (returns immediately)"""
+        word = word.strip()
+        if word:
+            self._queue.put((profile or NO_PROFILE, word, time.time()))
+
+    def boosts(self, profile):
+        """Get {word: boost} for a profile from the current snapshot"""
+        return self._snapshots.get(profile or NO_PROFILE, {})
+
+    def close(self):
+        """Flush queued writes and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        """Writer thread: owns the connection, applies queued writes and refreshes snapshots"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute(_SCHEMA)
+            connection.commit()
+        except Exception as e:
+            print(f"Error opening answer history {self.path}: {e}")
+            return
+
+        self._refresh(connection, None)
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            # Batch whatever else is already queued into the same transaction
+            items = [item]
+            while not self._queue.empty():
+                item = self._queue.get()
+                if item is None:
+                    self._queue.put(None)
+                    break
+                items.append(item)
+            try:
+                with connection:
+                    connection.executemany(_UPSERT, [(profile, word, seen, seen) for profile, word, seen in items])
+                self._refresh(connection, {profile for profile, _, _ in items})
+            except Exception as e:
+                print(f"Error recording answers: {e}")
+        connection.close()
+
+    def _refresh(self, connection, profiles):
+        """Rebuild the boost snapshot of some profiles (all if profiles is None)"""
+        now = time.time()
+        if profiles is None:
+            rows = connection.execute("SELECT profile, word, count, last_seen FROM answers").fetchall()
+            snapshots = {}
+        else:
+            rows = []
+            for profile in profiles:
+                rows += connection.execute("SELECT profile, word, count, last_seen FROM answers WHERE profile = ?",
+                                           (profile,)).fetchall()
+            snapshots = dict(self._snapshots)
+            for profile in profiles:
+                snapshots[profile] = {}
+
+        for profile, word, count, last_seen in rows:
+            snapshots.setdefault(profile, {})[word] = answer_boost(count, last_seen, now)
+        self._snapshots = snapshots
@@ -0,0 +1,132 @@
+"""
+OCR-tolerant fuzzy matching over a trie of the active words
+
+The trie is walked with one edit-distance row per node, so words sharing a
+prefix share the work and whole subtrees are pruned as soon as every cell of
+the row exceeds the allowed distance (a Levenshtein automaton run over the trie).
+"""
+
+# Cost of substituting characters OCR commonly confuses
+CONFUSABLE_COST = 0.5
+
+# Single characters OCR misreads for each other
+CONFUSABLE_CHARS = [
+    ('l', '1'), ('l', 'i'), ('i', '1'), ('l', '|'), ('i', 'j'),
+    ('o', '0'), ('o', 'c'), ('c', 'e'), ('s', '5'), ('z', '2'),
+    ('b', '6'), ('b', 'h'), ('g', '9'), ('q', '9'), ('a', 'o'),
+    ('n', 'h'), ('u', 'v'), ('t', 'f'),
+]
+
+# Character pairs OCR reads as a single glyph (and vice versa)
+CONFUSABLE_PAIRS = [
+    ('rn', 'm'), ('cl', 'd'), ('vv', 'w'), ('ri', 'n'), ('ii', 'u'),
+]
+
+_TERMINAL = '\0'
+
+
+def _build_confusable_tables():
+    """Build symmetric lookup tables for the confusable substitutions"""
+    chars = set()
+    for a, b in CONFUSABLE_CHARS:
+        chars.add((a, b))
+        chars.add((b, a))
+    pairs = {}
+    for pair, single in CONFUSABLE_PAIRS:
+        pairs.setdefault(pair, set()).add(single)
+    return chars, pairs
+
+
+_CONFUSABLE_CHAR_SET, _CONFUSABLE_PAIR_MAP = _build_confusable_tables()
+
+
+def substitution_cost(pattern_char, word_char):
+    """Cost of aligning one pattern character with one word character"""
+    if pattern_char == word_char or pattern_char == '_':
+        return 0.0
+    if (pattern_char, word_char) in _CONFUSABLE_CHAR_SET:
+        return CONFUSABLE_COST
+    return 1.0
+
+
+class FuzzyIndex:
+    """Trie over the active words answering weighted edit-distance queries"""
+
+    def __init__(self, words=None):
+        self.root = {}
+        if words:
+            self.build(words)
+
+    def build(self, words):
+        """Rebuild the trie for a list of words"""
+        self.root = {}
+        for word in words:
+            node = self.root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = word
+
+    def search(self, pattern, max_distance=1.0, exact_length=False):
+        """
+        Find words within max_distance of pattern
+
+        Args:
+            pattern (str): Pattern where _ matches any single character at no cost
+            max_distance (float): Largest weighted edit distance to accept
+            exact_length (bool): If False, the pattern only has to match a prefix of the word
+
+        Returns:
+            list: (word, distance) pairs ranked by distance, exact matches first
+        """
+        pattern = pattern.lower()
+        first_row = [float(j) for j in range(len(pattern) + 1)]
+        results = []
+
+        # Iterative DFS: (node, char leading to it, parent row, parent char,
+        # grandparent row, best distance of any prefix so far when prefixes may match)
+        best = None if exact_length else first_row[-1]
+        stack = [(child, char, first_row, None, None, best)
+                 for char, child in self.root.items() if char != _TERMINAL]
+        while stack:
+            node, char, prev_row, prev_char, grand_row, best = stack.pop()
+            row = self._next_row(pattern, char, prev_row, prev_char, grand_row)
+            if best is not None:
+                best = min(best, row[-1])
+
+            distance = row[-1] if best is None else best
+            word = node.get(_TERMINAL)
+            if word is not None and distance <= max_distance:
+                results.append((word, distance))
+
+            # Descendant cells come from this row or, through a pair confusable,
+            # from the parent row plus CONFUSABLE_COST; prune once both are out of reach
+            if (best is None or best > max_distance) and min(row) > max_distance and \
+                    min(prev_row) + CONFUSABLE_COST > max_distance:
+                continue
+
+            for child_char, child in node.items():
+                if child_char != _TERMINAL:
+                    stack.append((child, child_char, row, char, prev_row, best))
+
+        results.sort(key=lambda item: (item[1], len(item[0]), item[0]))
+        return results
+
+    @staticmethod
+    def _next_row(pattern, char, prev_row, prev_char, grand_row):
+        """Compute the DP row after consuming one more word character"""
+        row = [prev_row[0] + 1.0]
+        for j in range(1, len(pattern) + 1):
+            pattern_char = pattern[j - 1]
+            cost = min(
+                prev_row[j] + 1.0,                                     # extra word character
+                row[j - 1] + 1.0,                                      # missing word character
+                prev_row[j - 1] + substitution_cost(pattern_char, char),
+            )
+            # Two word characters read as one pattern character ("rn" -> "m")
+            if grand_row is not None and pattern_char in _CONFUSABLE_PAIR_MAP.get(prev_char + char, ()):
+                cost = min(cost, grand_row[j - 1] + CONFUSABLE_COST)
+            # One word character read as two pattern characters ("m" -> "rn")
+            if j >= 2 and char in _CONFUSABLE_PAIR_MAP.get(pattern[j - 2:j], ()):
+                cost = min(cost, prev_row[j - 2] + CONFUSABLE_COST)
+            row.append(cost)
+        return row
@@ -0,0 +1,109 @@
+"""
+Named game profiles: a wordlist selection plus the normalization and ranking
+rules of one drawing game
+
+Profiles are stored in settings.json next to the wordlist selection:
+    "game_profiles": {name: profile dict}, "active_profile": name or null
+"""
+import json
+import os
+
+# Result orderings a profile can default to (see ResultsDisplayFrame)
+SORT_ORDERS = ("length", "likelihood")
+
+
+class GameProfile:
+    """Wordlists and rules for one game"""
+
+    def __init__(self, name, wordlists, fold_diacritics=True, allow_digits=True, allow_multiword=True,
+                 sort_order="length"):
+        self.name = name
+        self.wordlists = list(wordlists)
+        self.fold_diacritics = fold_diacritics
+        self.allow_digits = allow_digits  # answers such as "3d"
+        self.allow_multiword = allow_multiword  # answers such as "alarm clock"
+        self.sort_order = sort_order if sort_order in SORT_ORDERS else "length"
+
+    def accepts(self, word):
+        """Check whether a wordlist entry can be an answer in this game"""
+        if not self.allow_digits and any(char.isdigit() for char in word):
+            return False
+        if not self.allow_multiword and ' ' in word.strip():
+            return False
+        return True
+
+    def rules_key(self):
+        """Everything besides the name that changes the built indexes"""
+        return (tuple(sorted(self.wordlists)), self.fold_diacritics, self.allow_digits, self.allow_multiword)
+
+    def to_dict(self):
+        """Serialize for settings.json"""
+        return {
+            "wordlists": self.wordlists,
+            "fold_diacritics": self.fold_diacritics,
+            "allow_digits": self.allow_digits,
+            "allow_multiword": self.allow_multiword,
+            "sort_order": self.sort_order,
+        }
+
+    @classmethod
+    def from_dict(cls, name, data):
+        """Deserialize from settings.json"""
+        return cls(
+            name,
+            data.get("wordlists", []),
+            fold_diacritics=data.get("fold_diacritics", True),
+            allow_digits=data.get("allow_digits", True),
+            allow_multiword=data.get("allow_multiword", True),
+            sort_order=data.get("sort_order", "length"),
+        )
+
+
+def default_profiles():
+    """Profiles for the bundled game wordlists"""
+    return {
+        "skribbl.io": GameProfile("skribbl.io", ["skribblio_wordlist.txt", "user_added_words.txt"],
+                                  allow_digits=False),
+        "Draw it": GameProfile("Draw it", ["drawit_wordlist.txt", "user_added_words.txt"]),
+        "Quick, Draw!": GameProfile("Quick, Draw!", ["google_quickdraw_wordlist.txt"],
+                                    allow_digits=False, sort_order="likelihood"),
+    }
+
+
+def load_profiles(settings_file):
+    """
+    Load game profiles from settings.json
+
+    Returns:
+        tuple: ({name: GameProfile}, active profile name or None)
+    """
+    profiles = default_profiles()
+    active = None
+    if os.path.exists(settings_file):
+        try:
+            with open(settings_file, 'r') as f:
+                settings = json.load(f)
+            for name, data in settings.get("game_profiles", {}).items():
+                profiles[name] = GameProfile.from_dict(name, data)
+            active = settings.get("active_profile")
+        except Exception as e:
+            print(f"Error loading game profiles: {e}")
+    return profiles, active if active in profiles else None
+
+
+def save_profiles(settings_file, profiles, active):
+    """Save game profiles and the active profile to settings.json, keeping other settings"""
+    settings = {}
+    if os.path.exists(settings_file):
+        try:
+            with open(settings_file, 'r') as f:
+                settings = json.load(f)
+        except Exception:
+            pass
+
+    settings["game_profiles"] = {name: profile.to_dict() for name, profile in profiles.items()}
+    settings["active_profile"] = active
+
+    os.makedirs(os.path.dirname(settings_file), exist_ok=True)
+    with open(settings_file, 'w') as f:
+        json.dump(settings, f)
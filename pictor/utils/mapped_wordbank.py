@@ -0,0 +1,188 @@
+"""
+Read-only, memory-mapped wordbank for dictionaries too large to load
+
+File layout (all integers little-endian uint64, so the tables can be cast in place):
+    b'PWB1' + 4 padding bytes, word count N, length count L
+    L x (length, first word index, word count)    per-length ranges
+    (N + 1) x byte offset into the blob            start of each word
+    blob: b'\\n' + folded words as UTF-8, each followed by b'\\n'
+
+Words are sorted by (length, folded word). Every length is therefore one
+contiguous, sorted range: exact-length queries read a single range, and prefix
+queries binary-search the prefix inside each range of sufficient length.
+Matching runs as a bytes regex over the mapped blob, so only matches become
+Python objects and the OS page cache holds the data.
+"""
+import mmap
+import re
+import struct
+
+from .normalization import fold
+from .patterns import excluded_check
+
+_MAGIC = b'PWB1\0\0\0\0'
+_HEADER = struct.Struct('<8sQQ')
+_RANGE = struct.Struct('<QQQ')
+# One UTF-8 encoded character other than the newline separator
+_UTF8_CHAR = rb'(?:[^\n\x80-\xbf][\x80-\xbf]*)'
+
+
+def write_mapped_wordbank(path, words, fold_diacritics=True):
+    """
+    Write words (folded and deduplicated) to a memory-mappable wordbank file
+
+    Returns:
+        int: Number of words written
+    """
+    keys = sorted({fold(word.strip(), fold_diacritics) for word in words if word.strip()} - {''},
+                  key=lambda key: (len(key), key))
+
+    ranges = []
+    for index, key in enumerate(keys):
+        if not ranges or ranges[-1][0] != len(key):
+            ranges.append([len(key), index, 0])
+        ranges[-1][2] += 1
+
+    offsets = []
+    position = 1
+    encoded = []
+    for key in keys:
+        data = key.encode('utf-8')
+        offsets.append(position)
+        encoded.append(data)
+        position += len(data) + 1
+    offsets.append(position)
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, len(keys), len(ranges)))
+        for length_range in ranges:
+            f.write(_RANGE.pack(*length_range))
+        f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        f.write(b'\n')
+        for data in encoded:
+            f.write(data + b'\n')
+    return len(keys)
+
+
+class MappedWordBank:
+    """Prefix and exact-length queries over a memory-mapped wordbank file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.word_count, range_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a mapped wordbank")
+
+        self.length_ranges = {}
+        position = _HEADER.size
+        for _ in range(range_count):
+            length, start, count = _RANGE.unpack_from(self._mmap, position)
+            self.length_ranges[length] = (start, start + count)
+            position += _RANGE.size
+        self._offsets = memoryview(self._mmap)[position:position + 8 * (self.word_count + 1)].cast('Q')
+        self._blob_start = position + 8 * (self.word_count + 1)
+
+    def __len__(self):
+        return self.word_count
+
+    def close(self):
+        """Release the mapping"""
+        self._offsets.release()
+        self._mmap.close()
+
+    def _span(self, index):
+        """Byte span (start, end) of a word in the file, without its newline"""
+        return self._blob_start + self._offsets[index], self._blob_start + self._offsets[index + 1] - 1
+
+    def word(self, index):
+        """Get the folded word at an index"""
+        start, end = self._span(index)
+        return self._mmap[start:end].decode('utf-8')
+
+    def _bisect(self, prefix, lo, hi, right=False):
+        """First index in [lo, hi) whose word is >= prefix (> every word starting with prefix if right)"""
+        size = len(prefix)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start, end = self._span(mid)
+            head = self._mmap[start:min(end, start + size)] if right else self._mmap[start:end]
+            if head < prefix or (right and head == prefix):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix, length):
+        """Index range of the words of one length starting with a folded prefix"""
+        lo, hi = self.length_ranges.get(length, (0, 0))
+        if not prefix:
+            return lo, hi
+        prefix = prefix.encode('utf-8')
+        start = self._bisect(prefix, lo, hi)
+        return start, self._bisect(prefix, start, hi, right=True)
+
+    def lengths(self, length, exact_length=False):
+        """Get the stored lengths a pattern of this length can match"""
+        if exact_length:
+            return [length] if length in self.length_ranges else []
+        return sorted(n for n in self.length_ranges if n >= length)
+
+    @staticmethod
+    def _compile(pattern, exact_length, mode):
+        """Build a bytes regex matching whole lines of the blob"""
+        body = b''.join(_UTF8_CHAR if char == '_' else re.escape(char.encode('utf-8')) for char in pattern)
+        if mode == "contains":
+            return re.compile(rb'^[^\n]*' + body + rb'[^\n]*$', re.MULTILINE)
+        return re.compile(b'^' + body + (b'$' if exact_length else rb'[^\n]*$'), re.MULTILINE)
+
+    def _ranges(self, pattern, exact_length, mode):
+        """Index ranges that can hold matches, in (length, word) order"""
+        if mode == "contains":
+            # Contains mode matches words of any length, like the other engines
+            return [self.length_ranges[length] for length in self.lengths(len(pattern))]
+        lengths = self.lengths(len(pattern), exact_length)
+        prefix = pattern.split('_', 1)[0]
+        return [self.prefix_range(prefix, length) for length in lengths]
+
+    def iter_matches(self, pattern, exact_length=False, mode="pattern"):
+        """Yield folded words matching a folded pattern, ordered by length then alphabetically"""
+        if not pattern:
+            return
+        regex = self._compile(pattern, exact_length, mode)
+        for lo, hi in self._ranges(pattern, exact_length, mode):
+            if lo >= hi:
+                continue
+            # Each word starts right after a newline, so ^ holds at the start of the range
+            begin, end = self._span(lo)[0], self._span(hi - 1)[1]
+            for match in regex.finditer(self._mmap, begin, end):
+                yield match.group().decode('utf-8')
+
+    def query(self, pattern, exact_length=False, mode="pattern", excluded=None):
+        """
+        Find words matching a folded pattern
+
+        Args:
+            pattern (str): Folded pattern, _ is a wildcard
+            exact_length (bool): Match the exact length instead of a prefix (pattern mode only)
+            mode (str): "pattern" or "contains"
+            excluded (str): Letters ruled out for every _ position
+
+        Returns:
+            list: Matching folded words, ordered by length then alphabetically
+        """
+        matches = list(self.iter_matches(pattern, exact_length, mode))
+        if excluded and '_' in pattern:
+            check = excluded_check(pattern, excluded, mode)
+            matches = [word for word in matches if check(word)]
+        return matches
+
+    def count(self, pattern, exact_length=False, mode="pattern"):
+        """Count matching words (prefix-only patterns are counted from the ranges alone)"""
+        if not pattern:
+            return 0
+        if mode == "pattern" and '_' not in pattern:
+            return sum(hi - lo for lo, hi in self._ranges(pattern, exact_length, mode))
+        return sum(1 for _ in self.iter_matches(pattern, exact_length, mode))
@@ -0,0 +1,61 @@
+"""
+Substring (n-gram) posting index used to narrow pattern and "contains" searches
+"""
+
+
+class NGramIndex:
+    """Maps every n-character substring to the ids of the words that contain it"""
+
+    def __init__(self, words=None, n=3):
+        self.n = n
+        self.postings = {}
+        if words:
+            self.build(words)
+
+    def build(self, words):
+        """Rebuild postings for a list of words (word id = position in the list)"""
+        self.postings = {}
+        for word_id, word in enumerate(words):
+            for gram in self.grams(word):
+                self.postings.setdefault(gram, set()).add(word_id)
+
+    def grams(self, text):
+        """Get the set of n-grams contained in text"""
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def literal_runs(self, pattern):
+        """Get the runs of known characters in a pattern that are long enough to index"""
+        return [run for run in pattern.lower().split('_') if len(run) >= self.n]
+
+    def pattern_grams(self, pattern):
+        """Get every n-gram a matching word must contain, given the literal runs of pattern"""
+        grams = set()
+        for run in self.literal_runs(pattern):
+            grams |= self.grams(run)
+        return grams
+
+    def posting_size(self, gram):
+        """Get the number of words containing gram"""
+        return len(self.postings.get(gram, ()))
+
+    def lookup(self, pattern):
+        """
+        Get candidate word ids for a pattern
+
+        Returns:
+            set: Ids of words containing every indexed run of the pattern, or
+                 None if the pattern has no literal run of at least n characters
+        """
+        grams = self.pattern_grams(pattern)
+        if not grams:
+            return None
+
+        # Intersect smallest postings first so the working set shrinks quickly
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return candidates
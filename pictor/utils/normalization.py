@@ -0,0 +1,23 @@
+"""
+Unicode normalization applied to wordlist entries and typed queries
+"""
+import unicodedata
+
+
+def fold(text, strip_diacritics=True):
+    """
+    Fold text into the key used for matching
+
+    Applies NFKC (compatibility forms, NFC/NFD unification), casefold and,
+    optionally, removes diacritics so "Crème Brûlée" and "creme brulee" share a key.
+    """
+    key = unicodedata.normalize('NFKC', text).casefold()
+    if strip_diacritics:
+        decomposed = unicodedata.normalize('NFD', key)
+        key = unicodedata.normalize('NFC', ''.join(c for c in decomposed if not unicodedata.combining(c)))
+    return key
+
+
+def display_form(text):
+    """Get the spelling shown to the user: stripped and composed, original casing kept"""
+    return unicodedata.normalize('NFC', text.strip())
@@ -0,0 +1,19 @@
+"""
+Underscore patterns as regular expressions
+
+Shared by WordFilter's regex check and the wordbanks, which apply the
+excluded-letter constraint after their own query.
+"""
+import re
+
+
+def pattern_to_regex(pattern, excluded=None):
+    """Translate an underscore pattern into an (unanchored) regex body"""
+    wildcard = f"[^{re.escape(excluded)}]" if excluded else '.'
+    return ''.join(wildcard if char == '_' else re.escape(char) for char in pattern)
+
+
+def excluded_check(pattern, excluded, mode="pattern"):
+    """Get a check that a folded word has none of the excluded letters at the pattern's _ positions"""
+    regex = re.compile(pattern_to_regex(pattern, excluded))
+    return regex.search if mode == "contains" else regex.match
@@ -0,0 +1,145 @@
+"""
+Cost-based query planner choosing which WordFilter indexes answer a pattern
+"""
+from collections import namedtuple
+
+
+# One index lookup in a plan: which index, the key looked up, its cached size,
+# a callable producing the set of candidate word ids, and the pattern positions
+# the lookup pins down (used to drop redundant lookups)
+PlanStep = namedtuple('PlanStep', ['index', 'key', 'estimate', 'fetch', 'covers'])
+
+
+class QueryPlanner:
+    """Estimates selectivity from cached posting sizes and orders index intersections"""
+
+    # Relative cost of regex-verifying one candidate vs. touching one id while intersecting
+    VERIFY_COST = 4.0
+    INTERSECT_COST = 1.0
+
+    # Above this fraction of the bank a lookup is no cheaper than a plain scan
+    SCAN_THRESHOLD = 0.5
+
+    def __init__(self, word_filter):
+        self.word_filter = word_filter
+
+    def access_paths(self, pattern, exact_length=False, mode="pattern"):
+        """List every index lookup that can narrow the candidates for a pattern"""
+        wf = self.word_filter
+        key = pattern.lower()
+        length = len(key)
+        paths = []
+
+        # Length histogram
+        if exact_length and mode == "pattern":
+            bucket = wf.length_buckets.get(length, set())
+            paths.append(PlanStep('length', length, len(bucket), lambda: bucket, frozenset()))
+        else:
+            size = sum(len(bucket) for n, bucket in wf.length_buckets.items() if n >= length)
+            paths.append(PlanStep('min_length', length, size,
+                                  lambda: wf.ids_with_min_length(length),
+                                  frozenset()))
+
+        # Substring n-grams work in every mode
+        for gram in sorted(wf.ngram_index.pattern_grams(key)):
+            paths.append(PlanStep('ngram', gram, wf.ngram_index.posting_size(gram),
+                                  lambda gram=gram: wf.ngram_index.postings.get(gram, set()),
+                                  frozenset()))
+
+        if mode != "pattern":
+            return paths
+
+        # Anchored lookups: leading run, trailing run (exact length only), known positions
+        prefix = key.split('_')[0]
+        if prefix:
+            paths.append(PlanStep('prefix', prefix, wf.prefix_index.count(prefix),
+                                  lambda: wf.prefix_index.lookup(prefix),
+                                  frozenset(range(len(prefix)))))
+
+        suffix = key.split('_')[-1]
+        if exact_length and suffix and suffix != key:
+            paths.append(PlanStep('suffix', suffix, wf.suffix_index.count(suffix),
+                                  lambda: wf.suffix_index.lookup(suffix),
+                                  frozenset(range(length - len(suffix), length))))
+
+        for position, char in enumerate(key):
+            if char != '_':
+                paths.append(PlanStep('position', (position, char),
+                                      wf.positional_index.posting_size(position, char),
+                                      lambda position=position, char=char: wf.positional_index.lookup(position, char),
+                                      frozenset([position])))
+
+        return paths
+
+    def plan(self, pattern, exact_length=False, mode="pattern"):
+        """
+        Choose and order index lookups for a pattern
+
+        Returns:
+            list: PlanSteps to intersect, most selective first; empty means full scan
+        """
+        total = len(self.word_filter.word_list)
+        if not total:
+            return []
+
+        paths = sorted(self.access_paths(pattern, exact_length, mode), key=lambda step: step.estimate)
+        if not paths or paths[0].estimate > total * self.SCAN_THRESHOLD:
+            return []
+
+        steps = [paths[0]]
+        covered = set(paths[0].covers)
+        expected = float(paths[0].estimate)
+        for step in paths[1:]:
+            # A prefix already pins its positions; skip lookups that add nothing new
+            if step.covers and step.covers <= covered:
+                continue
+            # Independence assumption: each posting keeps estimate/total of the candidates
+            selectivity = step.estimate / total
+            saved = self.VERIFY_COST * expected * (1.0 - selectivity)
+            if saved <= self.INTERSECT_COST * expected:
+                continue
+            steps.append(step)
+            covered |= step.covers
+            expected *= selectivity
+            if expected < 1.0:
+                break
+        return steps
+
+    def estimate(self, steps):
+        """Estimate the candidate count a plan produces"""
+        total = len(self.word_filter.word_list)
+        if not steps:
+            return total
+        expected = float(steps[0].estimate)
+        for step in steps[1:]:
+            expected *= step.estimate / total
+        return expected
+
+    def execute(self, steps, shared=None):
+        """
+        Intersect the postings of a plan
+
+        Args:
+            steps (list): Plan from plan()
+            shared (dict): Optional cache of partial intersections keyed by the
+                           steps taken so far, reused across plans in a batch
+
+        Returns:
+            set: Candidate word ids, or None when the plan is a full scan
+        """
+        if not steps:
+            return None
+        candidates = None
+        path = ()
+        for step in steps:
+            path += ((step.index, step.key),)
+            if shared is not None and path in shared:
+                candidates = shared[path]
+            else:
+                posting = step.fetch()
+                candidates = set(posting) if candidates is None else candidates & posting
+                if shared is not None:
+                    shared[path] = candidates
+            if not candidates:
+                break
+        return candidates
@@ -0,0 +1,165 @@
+"""
+Wordbank stored in a local SQLite database
+
+SQLite's LIKE already treats _ as a single-character wildcard, so a pattern
+maps almost directly onto an indexed query. Rows hold one wordlist membership
+each and are indexed by (length, first letter, folded word), so a bank never
+has to be held in Python memory to be searched.
+"""
+import os
+import re
+import sqlite3
+
+from .normalization import fold, display_form
+from .patterns import excluded_check
+
+WORDBANK_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "wordbank.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    wordlist TEXT NOT NULL,
+    word TEXT NOT NULL,
+    display TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    first TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS words_length_first_word ON words (length, first, word);
+CREATE INDEX IF NOT EXISTS words_word ON words (word);
+CREATE TABLE IF NOT EXISTS sources (
+    wordlist TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    folded INTEGER NOT NULL
+);
+"""
+
+
+def like_pattern(pattern, exact_length=False, mode="pattern"):
+    """Translate an underscore pattern into a LIKE pattern (escape character: backslash)"""
+    body = re.sub(r'([\\%])', r'\\\1', pattern)
+    if mode == "contains":
+        return f"%{body}%"
+    return body if exact_length else body + '%'
+
+
+class SQLiteWordBank:
+    """Wordlist memberships in SQLite, queried with LIKE"""
+
+    def __init__(self, path=WORDBANK_PATH, fold_diacritics=True):
+        self.path = path
+        self.fold_diacritics = fold_diacritics
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        # Keys are already folded; case-sensitive LIKE lets SQLite use the word index for prefixes
+        self.connection.execute("PRAGMA case_sensitive_like = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+    def sync(self, wordlists_folder, filenames):
+        """
+        Load wordlist files whose contents or folding rules changed since the last sync
+
+        Returns:
+            list: Filenames that were (re)loaded
+        """
+        loaded = []
+        for filename in filenames:
+            file_path = os.path.join(wordlists_folder, filename)
+            if not os.path.exists(file_path):
+                continue
+            stat = os.stat(file_path)
+            row = self.connection.execute("SELECT mtime, size, folded FROM sources WHERE wordlist = ?",
+                                          (filename,)).fetchone()
+            if row == (stat.st_mtime, stat.st_size, int(self.fold_diacritics)):
+                continue
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    self._load(filename, f)
+                with self.connection:
+                    self.connection.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                                            (filename, stat.st_mtime, stat.st_size, int(self.fold_diacritics)))
+                loaded.append(filename)
+            except Exception as e:
+                print(f"Error loading {filename} into wordbank: {e}")
+        return loaded
+
+    def _load(self, filename, lines):
+        """Replace the rows of one wordlist"""
+        rows = {}
+        for line in lines:
+            if line.strip():
+                key = fold(line.strip(), self.fold_diacritics)
+                if key:
+                    rows.setdefault(key, (filename, key, display_form(line), len(key), key[0]))
+        with self.connection:
+            self.connection.execute("DELETE FROM words WHERE wordlist = ?", (filename,))
+            self.connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?, ?)", rows.values())
+
+    @staticmethod
+    def _scope(wordlists, profile=None):
+        """WHERE clauses and parameters limiting rows to the wordlists and a game profile's rules"""
+        clauses = [f"wordlist IN ({', '.join('?' * len(wordlists))})"]
+        if profile is not None and not profile.allow_digits:
+            clauses.append("display NOT GLOB '*[0-9]*'")
+        if profile is not None and not profile.allow_multiword:
+            clauses.append("display NOT LIKE '% %'")
+        return clauses, list(wordlists)
+
+    def _where(self, pattern, exact_length, mode, wordlists, profile=None):
+        """Build the WHERE clause and parameters for a folded pattern"""
+        clauses, params = self._scope(wordlists, profile)
+        if mode == "contains":
+            clauses.append("length >= ?")
+            params.append(len(pattern))
+        else:
+            clauses.append("length = ?" if exact_length else "length >= ?")
+            params.append(len(pattern))
+            if pattern[0] != '_':
+                clauses.append("first = ?")
+                params.append(pattern[0])
+        clauses.append("word LIKE ? ESCAPE '\\'")
+        params.append(like_pattern(pattern, exact_length, mode))
+        return " AND ".join(clauses), params
+
+    def query(self, pattern, wordlists, exact_length=False, mode="pattern", excluded=None, profile=None):
+        """
+        Find words matching a folded pattern
+
+        Args:
+            pattern (str): Folded pattern, _ is a wildcard
+            wordlists (list): Wordlist filenames to search
+            exact_length (bool): Match the exact length instead of a prefix (pattern mode only)
+            mode (str): "pattern" or "contains"
+            excluded (str): Letters ruled out for every _ position (checked after the query)
+            profile (GameProfile): Profile whose digit and multiword rules filter the words
+
+        Returns:
+            list: (folded word, display form) tuples sorted by folded word
+        """
+        if not pattern or not wordlists:
+            return []
+        where, params = self._where(pattern, exact_length, mode, wordlists, profile)
+        rows = self.connection.execute(
+            f"SELECT word, MIN(display) FROM words WHERE {where} GROUP BY word ORDER BY word", params).fetchall()
+        if excluded and '_' in pattern:
+            check = excluded_check(pattern, excluded, mode)
+            rows = [row for row in rows if check(row[0])]
+        return rows
+
+    def count(self, pattern, wordlists, exact_length=False, mode="pattern", profile=None):
+        """Count distinct words matching a folded pattern"""
+        if not pattern or not wordlists:
+            return 0
+        where, params = self._where(pattern, exact_length, mode, wordlists, profile)
+        return self.connection.execute(f"SELECT COUNT(DISTINCT word) FROM words WHERE {where}", params).fetchone()[0]
+
+    def size(self, wordlists, profile=None):
+        """Count distinct words in the wordlists"""
+        if not wordlists:
+            return 0
+        clauses, params = self._scope(wordlists, profile)
+        return self.connection.execute(
+            f"SELECT COUNT(DISTINCT word) FROM words WHERE {' AND '.join(clauses)}", params).fetchone()[0]
@@ -0,0 +1,137 @@
+"""
+NumPy matching engine over fixed-width character matrices
+
+Each length bucket of the active words is packed into a (words x positions)
+matrix of code points, so a pattern becomes a handful of column-wise equality
+masks combined with np.logical_and.reduce instead of one regex call per word.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy ships with opencv-python, but the engine stays optional
+    np = None
+
+
+def numpy_available():
+    """Check whether the NumPy engine can be used"""
+    return np is not None
+
+
+class CharMatrixIndex:
+    """Length buckets of the active words packed into code point matrices"""
+
+    def __init__(self, words=None):
+        if np is None:
+            raise ImportError("CharMatrixIndex requires numpy")
+        self.matrices = {}
+        self.ids = {}
+        self.word_lengths = np.zeros(0, dtype=np.int64)
+        if words:
+            self.build(words)
+
+    def build(self, words):
+        """Pack words into one matrix per length (word id = position in the list)"""
+        buckets = {}
+        for word_id, word in enumerate(words):
+            buckets.setdefault(len(word), []).append(word_id)
+
+        self.matrices = {}
+        self.ids = {}
+        self.word_lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+        for length, word_ids in buckets.items():
+            if length == 0:
+                continue
+            text = ''.join(words[i] for i in word_ids)
+            matrix = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).reshape(len(word_ids), length)
+            # Most banks are Latin-1 after folding; uint8 quarters the memory traffic
+            if matrix.max() < 256:
+                matrix = matrix.astype(np.uint8)
+            self.matrices[length] = matrix
+            self.ids[length] = np.asarray(word_ids, dtype=np.int64)
+
+    def lengths(self, length, exact_length=False):
+        """Get the bucket lengths a pattern of this length can match"""
+        if exact_length:
+            return [length] if length in self.matrices else []
+        return sorted(n for n in self.matrices if n >= length)
+
+    def bucket_mask(self, pattern, length, excluded=None, cache=None):
+        """
+        Evaluate a pattern against one length bucket
+
+        Args:
+            pattern (str): Folded pattern, _ is a wildcard
+            length (int): Bucket to evaluate (must be >= len(pattern))
+            excluded (str): Letters known not to occupy any wildcard position
+            cache (dict): Optional column masks shared by a batch of patterns
+
+        Returns:
+            numpy.ndarray: Boolean mask over the rows of the bucket matrix
+        """
+        matrix = self.matrices[length]
+        columns = []
+        for position, char in enumerate(pattern):
+            if char == '_':
+                continue
+            code = ord(char)
+            if code > np.iinfo(matrix.dtype).max:
+                return np.zeros(len(matrix), dtype=bool)
+            if cache is None:
+                columns.append(matrix[:, position] == code)
+                continue
+            key = (length, position, code)
+            if key not in cache:
+                cache[key] = matrix[:, position] == code
+            columns.append(cache[key])
+
+        if excluded:
+            wildcards = [position for position, char in enumerate(pattern) if char == '_']
+            if wildcards:
+                codes = [ord(char) for char in excluded if ord(char) <= np.iinfo(matrix.dtype).max]
+                columns.append(~np.isin(matrix[:, wildcards], codes).any(axis=1))
+
+        if not columns:
+            return np.ones(len(matrix), dtype=bool)
+        return np.logical_and.reduce(columns)
+
+    def match_ids(self, pattern, exact_length=False, excluded=None, cache=None):
+        """Get the sorted ids of words matching a pattern"""
+        found = [self.ids[length][self.bucket_mask(pattern, length, excluded, cache)]
+                 for length in self.lengths(len(pattern), exact_length)]
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(found))
+
+    def count(self, pattern, exact_length=False, excluded=None, cache=None):
+        """Count matching words without materializing them"""
+        return int(sum(np.count_nonzero(self.bucket_mask(pattern, length, excluded, cache))
+                       for length in self.lengths(len(pattern), exact_length)))
+
+    def position_histograms(self, word_ids, positions):
+        """
+        Count the letters found at each position among a set of words
+
+        Args:
+            word_ids: Ids of the candidate words
+            positions (list): Positions to histogram
+
+        Returns:
+            dict: position -> {letter: count}
+        """
+        word_ids = np.asarray(word_ids, dtype=np.int64)
+        histograms = {position: {} for position in positions}
+        lengths = self.word_lengths[word_ids]
+        for length in np.unique(lengths):
+            length = int(length)
+            if length not in self.matrices:
+                continue
+            # Bucket ids are ascending, so rows can be found by binary search
+            rows = np.searchsorted(self.ids[length], word_ids[lengths == length])
+            matrix = self.matrices[length]
+            for position in positions:
+                if position >= length:
+                    continue
+                codes, counts = np.unique(matrix[rows, position], return_counts=True)
+                histogram = histograms[position]
+                for code, count in zip(codes.tolist(), counts.tolist()):
+                    histogram[chr(code)] = histogram.get(chr(code), 0) + count
+        return histograms
@@ -1,12 +1,56 @@
 import re
 import os
 import json
+import math
+from collections import OrderedDict
+
+from .ngram_index import NGramIndex
+from .word_indexes import PositionalIndex, AffixIndex
+from .query_planner import QueryPlanner
+from .fuzzy_matching import FuzzyIndex
+from .anagram_index import AnagramIndex
+from .normalization import fold, display_form
+from .patterns import pattern_to_regex
+from .vector_matching import CharMatrixIndex, numpy_available
+from .word_frequency import FREQUENCY_TABLE_PATH, load_frequency_table
+from .game_profiles import load_profiles, save_profiles
+from .sqlite_wordbank import WORDBANK_PATH, SQLiteWordBank
+from .mapped_wordbank import MappedWordBank
+
+# Matching engines for pattern queries: Python indexes + regex, NumPy character matrices,
+# or LIKE queries against the SQLite wordbank
+ENGINES = ("index", "numpy", "sqlite")
+# Packed posting bitsets kept for count(); least recently used ones are dropped beyond this
+BITSET_CACHE_SIZE = 256
+
+def _binary_entropy(p):
+    """Information (bits) in a yes/no answer that is yes with probability p"""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -p * math.log2(p) - (1.0 - p) * math.log2(1.0 - p)
+
+
+# int.bit_count needs Python 3.10
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(bits):
+        return bin(bits).count('1')
 
 
 class WordFilter:
     """Handles word filtering and pattern matching with persistent user wordlists"""
     
-    def __init__(self, wordlists_folder=None, user_words_file=None):
+    # Everything rebuilt per wordlist selection; swapped wholesale when switching game profiles
+    PROFILE_STATE = (
+        'selected_files', 'fold_diacritics', 'display_forms', 'word_set', 'word_list', 'display_list',
+        'length_buckets', '_min_length_ids', '_bitsets', 'ngram_index', 'positional_index',
+        'prefix_index', 'suffix_index', '_fuzzy_index', '_anagram_index', '_char_matrix',
+        'word_scores', 'display_scores',
+    )
+    
+    def __init__(self, wordlists_folder=None, user_words_file=None, fold_diacritics=True, engine="index",
+                 mapped_wordbank=None):
         self.wordlists_folder = wordlists_folder or self._get_wordlists_folder()
         self.user_words_file = user_words_file or os.path.join(self.wordlists_folder, "user_added_words.txt")
         self.settings_file = os.path.join(os.path.dirname(self.wordlists_folder), "settings.json")
@@ -15,10 +59,53 @@ class WordFilter:
         self.available_files = self._get_available_wordlists()
         self.selected_files = self._load_selected_files()
         
+        # Words are matched on folded keys and shown in their original spelling
+        self.fold_diacritics = fold_diacritics
+        self.display_forms = {}
+        
+        # Game profiles (None = the plain wordlist selection); built indexes are kept per profile
+        self.profiles, self.active_profile = load_profiles(self.settings_file)
+        self.default_fold_diacritics = fold_diacritics
+        self._profile_states = {}
+        if self.active_profile is not None:
+            self.selected_files = list(self.profiles[self.active_profile].wordlists)
+            self.fold_diacritics = self.profiles[self.active_profile].fold_diacritics
+        
+        # Likelihood scores, joined to the words once the frequency table is first needed
+        self.frequency_table_path = FREQUENCY_TABLE_PATH
+        self._frequency_table = None
+        self.word_scores = []
+        self.display_scores = {}
+        # Optional AnswerHistory whose per-profile boosts rank previously seen answers first
+        self.answer_history = None
+        
         # Load combined word list
         self.word_set = set()
         self.word_list = []
-        self._load_all_wordlists()
+        self.display_list = []
+        self.length_buckets = {}
+        self._min_length_ids = {}
+        self._bitsets = OrderedDict()
+        self.index_version = 0
+        self.ngram_index = NGramIndex()
+        self.positional_index = PositionalIndex()
+        self.prefix_index = AffixIndex()
+        self.suffix_index = AffixIndex(from_end=True)
+        self.planner = QueryPlanner(self)
+        self.fuzzy_max_distance = 1.0
+        self._fuzzy_index = None
+        self._anagram_index = None
+        self._char_matrix = None
+        self.wordbank_path = WORDBANK_PATH
+        self._wordbank = None
+        self._wordbank_version = None
+        
+        # A memory-mapped wordbank file replaces the in-memory word list (pattern and contains modes only)
+        self.mapped_wordbank = MappedWordBank(mapped_wordbank) if mapped_wordbank else None
+        self.engine = "index"
+        self.set_engine(engine)
+        if self.mapped_wordbank is None:
+            self._load_all_wordlists()
         
     def _get_wordlists_folder(self):
         """Get the wordlists folder path"""
@@ -68,19 +155,175 @@ class WordFilter:
     def _load_all_wordlists(self):
         """Load words from all selected wordlist files"""
         self.word_set = set()
+        self.display_forms = {}
+        profile = self.profiles.get(self.active_profile)
+        if self.engine == "sqlite":
+            # The words stay in the SQLite wordbank, synced with the selection on the next query
+            self.word_list = []
+            self._build_indexes()
+            return
         
         for filename in self.selected_files:
             file_path = os.path.join(self.wordlists_folder, filename)
             if os.path.exists(file_path):
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
-                        words = [line.strip().lower() for line in f if line.strip()]
-                        self.word_set.update(words)
+                        for line in f:
+                            if line.strip() and (profile is None or profile.accepts(line)):
+                                self._add_to_index(line)
                 except Exception as e:
                     print(f"Error loading {filename}: {e}")
         
         # Convert to sorted list
         self.word_list = sorted(list(self.word_set))
+        self._build_indexes()
+    
+    def normalize(self, text):
+        """Fold text (wordlist entry or query) into its matching key"""
+        return fold(text, self.fold_diacritics)
+    
+    def _add_to_index(self, word):
+        """Register a word's folded key and display form; the first spelling seen wins"""
+        key = self.normalize(word.strip())
+        self.word_set.add(key)
+        self.display_forms.setdefault(key, display_form(word))
+        return key
+    
+    def _build_indexes(self):
+        """Rebuild the search indexes over the active word list (word id = index in word_list)"""
+        self.index_version += 1
+        self.display_list = [self.display_forms.get(word, word) for word in self.word_list]
+        self.length_buckets = {}
+        self._min_length_ids = {}
+        self._bitsets = OrderedDict()
+        for word_id, word in enumerate(self.word_list):
+            self.length_buckets.setdefault(len(word), set()).add(word_id)
+        self.ngram_index.build(self.word_list)
+        self.positional_index.build(self.word_list)
+        self.prefix_index.build(self.word_list)
+        self.suffix_index.build(self.word_list)
+        # The fuzzy trie, anagram index and character matrices are only needed once used
+        self._fuzzy_index = None
+        self._anagram_index = None
+        self._char_matrix = None
+        if self._frequency_table is not None:
+            self._join_scores()
+    
+    def _join_scores(self):
+        """Precompute a likelihood score for every active word"""
+        table = self._frequency_table
+        self.word_scores = [table.get(word) or table.get(fold(word), 0) for word in self.word_list]
+        self.display_scores = dict(zip(self.display_list, self.word_scores))
+    
+    def answer_boosts(self):
+        """Get {display word: boost} for answers seen before in the active profile (in-memory snapshot)"""
+        if self.answer_history is None:
+            return {}
+        return self.answer_history.boosts(self.active_profile)
+    
+    def rank_by_length(self, words):
+        """Sort previously seen answers first, then by length and alphabetically"""
+        boosts = self.answer_boosts()
+        if not boosts:
+            return sorted(words, key=lambda w: (len(w), w.lower()))
+        return sorted(words, key=lambda w: (-boosts.get(w, 0), len(w), w.lower()))
+    
+    def rank_by_likelihood(self, words):
+        """Sort words most likely first (seen answers, then frequency score), then by length and alphabetically"""
+        if self._frequency_table is None:
+            self._frequency_table = load_frequency_table(self.frequency_table_path)
+            self._join_scores()
+        scores = self.display_scores
+        if self.engine == "sqlite":
+            # No in-memory word list to join the scores to: look the results up directly
+            table = self._frequency_table
+            scores = {w: table.get(self.normalize(w)) or table.get(fold(w), 0) for w in words}
+        boosts = self.answer_boosts()
+        return sorted(words, key=lambda w: (-boosts.get(w, 0), -scores.get(w, 0), len(w), w.lower()))
+    
+    def _rules_key(self, name):
+        """Inputs the indexes of a profile (or the plain selection) were built from"""
+        if name is None:
+            return (tuple(sorted(self.selected_files)), self.fold_diacritics, True, True)
+        return self.profiles[name].rules_key()
+    
+    def _export_state(self):
+        """Snapshot the current indexes"""
+        return {attr: getattr(self, attr) for attr in self.PROFILE_STATE}
+    
+    def _reset_state(self):
+        """Point at fresh, empty index objects so a snapshot is not rebuilt in place"""
+        self.ngram_index = NGramIndex()
+        self.positional_index = PositionalIndex()
+        self.prefix_index = AffixIndex()
+        self.suffix_index = AffixIndex(from_end=True)
+        self.word_scores = []
+        self.display_scores = {}
+    
+    def _load_profile(self, name):
+        """Build the indexes of a profile from its wordlist files"""
+        self._reset_state()
+        if name is None:
+            self.selected_files = self._load_selected_files()
+            self.fold_diacritics = self.default_fold_diacritics
+        else:
+            self.selected_files = list(self.profiles[name].wordlists)
+            self.fold_diacritics = self.profiles[name].fold_diacritics
+        self._load_all_wordlists()
+    
+    def activate_profile(self, name):
+        """
+        Switch to a game profile, or None for the plain wordlist selection
+        
+        A profile that was used or warmed before is swapped in without reading
+        any wordlist file.
+        
+        Returns:
+            bool: True if the profile is now active
+        """
+        if name is not None and name not in self.profiles:
+            return False
+        if name == self.active_profile:
+            return True
+        
+        self._profile_states[self.active_profile] = (self._rules_key(self.active_profile), self._export_state())
+        self.active_profile = name
+        rules, state = self._profile_states.get(name, (None, None))
+        if state is not None and (name is None or rules == self._rules_key(name)):
+            for attr, value in state.items():
+                setattr(self, attr, value)
+            # Profiles warmed before the frequency table was loaded carry no scores yet
+            if self._frequency_table is not None and len(self.word_scores) != len(self.word_list):
+                self._join_scores()
+            self.index_version += 1
+        else:
+            self._load_profile(name)
+        
+        save_profiles(self.settings_file, self.profiles, self.active_profile)
+        return True
+    
+    def warm_profile(self, name):
+        """Build a profile's indexes in the background of the active one so switching to it is instant"""
+        if name not in self.profiles or name == self.active_profile:
+            return
+        rules, state = self._profile_states.get(name, (None, None))
+        if state is not None and rules == self._rules_key(name):
+            return
+        
+        current, version, active = self._export_state(), self.index_version, self.active_profile
+        self.active_profile = name
+        self._load_profile(name)
+        self._profile_states[name] = (self._rules_key(name), self._export_state())
+        for attr, value in current.items():
+            setattr(self, attr, value)
+        # The active indexes did not change, so caches keyed on the version stay valid
+        self.index_version, self.active_profile = version, active
+    
+    def _forget_profiles_using(self, filename):
+        """Drop warm indexes of inactive profiles built from a file that changed"""
+        for name, (rules, state) in list(self._profile_states.items()):
+            if filename in state['selected_files']:
+                del self._profile_states[name]
     
     def get_wordlist_info(self):
         """Get information about available wordlists"""
@@ -104,48 +347,330 @@ class WordFilter:
         
         return wordlist_info
     
-    def filter_words(self, pattern, exact_length=False):
+    def set_engine(self, engine):
+        """
+        Select the engine answering pattern queries ("index", "numpy" or "sqlite")
+        
+        The sqlite engine keeps the words in the SQLite wordbank instead of
+        building the in-memory indexes, so like a mapped wordbank it answers
+        pattern and contains modes only.
+        """
+        if engine not in ENGINES:
+            print(f"Unknown matching engine '{engine}', using 'index'")
+            engine = "index"
+        elif engine == "numpy" and not numpy_available():
+            print("NumPy is not installed, using 'index' matching engine")
+            engine = "index"
+        previous, self.engine = self.engine, engine
+        # Switching to or from sqlite drops or rebuilds the in-memory word list
+        if self.index_version and self.mapped_wordbank is None and (previous == "sqlite") != (engine == "sqlite"):
+            self._profile_states = {}
+            self._load_all_wordlists()
+    
+    def filter_words(self, pattern, exact_length=False, mode="pattern", excluded=None):
         """
         Filter word list based on pattern with underscores
         
         Args:
             pattern (str): Pattern like "d___i" where _ represents unknown letters
             exact_length (bool): If True, match exact length; if False, allow longer matches
+                                 (ignored in contains mode, which matches words of any length)
+            mode (str): "pattern" anchors the pattern at the start of the word,
+                        "contains" matches it anywhere inside the word,
+                        "fuzzy" tolerates OCR errors (ranked by edit distance),
+                        "anagram" matches scrambled letters (_ = unknown letter),
+                        "letters" matches words containing all the given letters
+            excluded (str): Letters ruled out for every _ position (pattern and contains modes)
             
         Returns:
             list: Matching words
         """
+        pattern = self.normalize(pattern)
         if not pattern:
             return []
+        
+        if self.mapped_wordbank is not None:
+            return self._filter_mapped(pattern, exact_length, mode, excluded)
+        if self.engine == "sqlite":
+            return self._filter_sqlite(pattern, exact_length, mode, excluded)
+        if mode == "fuzzy":
+            return [word for word, _ in self.fuzzy_search(pattern, exact_length=exact_length)]
+        if mode in ("anagram", "letters"):
+            return self._filter_letters(pattern, mode)
+        
+        if excluded:
+            excluded = self.normalize(excluded)
+        return [self.display_list[i] for i in self._matching_ids(pattern, exact_length, mode, excluded)]
+    
+    def filter_many(self, patterns, exact_length=False, mode="pattern", counts_only=False):
+        """
+        Evaluate many patterns in one pass (e.g. several OCR readings of a frame)
+        
+        Patterns are grouped by length and shape so that plans sharing lookups run
+        back to back and reuse each other's index intersections (or, with the numpy
+        engine, column masks).
+        
+        Returns:
+            dict: Pattern -> list of matching words, or match count if counts_only
+        """
+        results = {}
+        if mode not in ("pattern", "contains") or self.mapped_wordbank is not None or self.engine == "sqlite":
+            for pattern in patterns:
+                matches = self.filter_words(pattern, exact_length, mode)
+                results[pattern] = len(matches) if counts_only else matches
+            return results
+        
+        keyed = sorted(((self.normalize(pattern), pattern) for pattern in set(patterns)),
+                       key=lambda item: (len(item[0]), self._pattern_shape(item[0]), item[0]))
+        shared = {}
+        for key, pattern in keyed:
+            if not key:
+                results[pattern] = 0 if counts_only else []
+                continue
             
-        # If pattern contains no wildcards, do prefix matching
+            word_ids = self._matching_ids(key, exact_length, mode, shared=shared)
+            results[pattern] = len(word_ids) if counts_only else [self.display_list[i] for i in word_ids]
+        return results
+    
+    def count(self, pattern, exact_length=False, mode="pattern"):
+        """
+        Count matches without building the result list
+        
+        Pattern-mode queries are answered from posting cardinalities (prefix
+        ranges, length buckets, word membership) or from popcounts of the
+        intersected positional bitsets, so they are cheap enough for every keystroke.
+        """
+        pattern = self.normalize(pattern)
+        if not pattern:
+            return 0
+        if self.mapped_wordbank is not None:
+            return self.mapped_wordbank.count(pattern, exact_length, mode) if mode in ("pattern", "contains") else 0
+        if self.engine == "sqlite":
+            if mode not in ("pattern", "contains"):
+                return 0
+            return self._get_wordbank().count(pattern, self.selected_files, exact_length, mode,
+                                              self.profiles.get(self.active_profile))
+        if mode == "contains":
+            return len(self._matching_ids(pattern, exact_length, mode))
+        if mode != "pattern":
+            return len(self.filter_words(pattern, exact_length, mode))
+        if self.engine == "numpy":
+            return self._get_char_matrix().count(pattern, exact_length)
+        
         if '_' not in pattern:
-            try:
-                # Escape pattern and match continuation based on exact_length
-                if exact_length:
-                    regex = re.compile(f"^{re.escape(pattern)}$", re.IGNORECASE)
-                else:
-                    regex = re.compile(f"^{re.escape(pattern)}.*$", re.IGNORECASE)
-                return [word for word in self.word_list if regex.match(word)]
-            except re.error:
-                return []
-        # Otherwise treat _ as single-character wildcard
-        regex_pattern = pattern.replace('_', '.')
-        try:
-            # Match words based on exact_length
             if exact_length:
-                regex = re.compile(f"^{regex_pattern}$", re.IGNORECASE)
-            else:
-                regex = re.compile(f"^{regex_pattern}.*$", re.IGNORECASE)
-            return [word for word in self.word_list if regex.match(word)]
-        except re.error:
+                return 1 if pattern in self.word_set else 0
+            return self.prefix_index.count(pattern)
+        
+        # Known positions AND the length constraint, as bitsets
+        if exact_length:
+            bits = self._get_bitset(('length', len(pattern)), lambda: self.length_buckets.get(len(pattern), ()))
+        else:
+            bits = self._get_bitset(('min_length', len(pattern)), lambda: self.ids_with_min_length(len(pattern)))
+        for position, char in enumerate(pattern):
+            if not bits:
+                break
+            if char != '_':
+                bits &= self._get_bitset(('position', position, char),
+                                         lambda: self.positional_index.lookup(position, char))
+        return _popcount(bits)
+    
+    def suggest_reveals(self, pattern, exact_length=False, limit=5, max_candidates=20000):
+        """
+        Rank the guesses that would best split the words still matching pattern
+        
+        Asking "is letter X at blank i?" is worth the binary entropy of the share
+        of candidates with X there; guessing a whole word is worth the entropy of
+        a 1-in-n hit. Letter shares come from per-position histograms over the
+        candidates (vectorized with numpy when available).
+        
+        Returns:
+            list: Dicts with 'kind' ("letter" or "word"), 'position'/'letter' or
+                  'word', and 'gain' in bits, best first
+        """
+        key = self.normalize(pattern)
+        if not key:
+            return []
+        word_ids = self._matching_ids(key, exact_length, "pattern")
+        total = len(word_ids)
+        if total < 2:
+            return []
+        
+        # Histogram an even sample of very large candidate sets
+        if total > max_candidates:
+            word_ids = word_ids[::-(-total // max_candidates)]
+        blanks = [position for position, char in enumerate(key) if char == '_']
+        histograms = self._position_histograms(word_ids, blanks)
+        
+        sampled = len(word_ids)
+        suggestions = []
+        for position, counts in histograms.items():
+            for letter, count in counts.items():
+                if count < sampled:
+                    suggestions.append({'kind': 'letter', 'position': position, 'letter': letter,
+                                        'gain': _binary_entropy(count / sampled)})
+        word_gain = _binary_entropy(1.0 / total)
+        suggestions.extend({'kind': 'word', 'word': self.display_list[i], 'gain': word_gain}
+                           for i in word_ids[:limit])
+        
+        suggestions.sort(key=lambda suggestion: suggestion['gain'], reverse=True)
+        return suggestions[:limit]
+    
+    def _position_histograms(self, word_ids, positions):
+        """Count letters at each position among the candidate words"""
+        if numpy_available():
+            return self._get_char_matrix().position_histograms(word_ids, positions)
+        histograms = {position: {} for position in positions}
+        for word_id in word_ids:
+            word = self.word_list[word_id]
+            for position in positions:
+                if position < len(word):
+                    histogram = histograms[position]
+                    histogram[word[position]] = histogram.get(word[position], 0) + 1
+        return histograms
+    
+    def _get_bitset(self, key, get_ids):
+        """Get a posting as an int bitset (bit i = word id i), building it on first use (LRU cached)"""
+        bits = self._bitsets.get(key)
+        if bits is not None:
+            self._bitsets.move_to_end(key)
+            return bits
+        packed = bytearray(len(self.word_list) // 8 + 1)
+        for word_id in get_ids():
+            packed[word_id >> 3] |= 1 << (word_id & 7)
+        bits = self._bitsets[key] = int.from_bytes(packed, 'little')
+        while len(self._bitsets) > BITSET_CACHE_SIZE:
+            self._bitsets.popitem(last=False)
+        return bits
+    
+    @staticmethod
+    def _pattern_shape(pattern):
+        """Get the known/unknown layout of a pattern (d_g -> #_#)"""
+        return ''.join('_' if char == '_' else '#' for char in pattern)
+    
+    def explain(self, pattern, exact_length=False, mode="pattern"):
+        """
+        Report how a pattern would be answered, for tuning the query planner
+        
+        Returns:
+            dict: Chosen plan steps with their posting sizes, estimated and actual
+                  candidate counts, and the final number of matches
+        """
+        pattern = self.normalize(pattern)
+        steps = self.planner.plan(pattern, exact_length, mode)
+        candidates = self.planner.execute(steps)
+        return {
+            'plan': [{'index': step.index, 'key': step.key, 'estimate': step.estimate} for step in steps] or [{'index': 'scan'}],
+            'estimated_candidates': round(self.planner.estimate(steps)),
+            'actual_candidates': len(self.word_list) if candidates is None else len(candidates),
+            'matches': len(self.filter_words(pattern, exact_length, mode)) if pattern else 0,
+        }
+    
+    def _filter_mapped(self, pattern, exact_length, mode, excluded=None):
+        """Answer a folded pattern from the memory-mapped wordbank (results are folded words)"""
+        if mode not in ("pattern", "contains"):
+            return []
+        if excluded:
+            excluded = self.normalize(excluded)
+        return self.mapped_wordbank.query(pattern, exact_length, mode, excluded)
+    
+    def _filter_sqlite(self, pattern, exact_length, mode, excluded=None):
+        """Answer a folded pattern from the SQLite wordbank (results are display forms)"""
+        if mode not in ("pattern", "contains"):
+            return []
+        if excluded:
+            excluded = self.normalize(excluded)
+        rows = self._get_wordbank().query(pattern, self.selected_files, exact_length, mode, excluded,
+                                          self.profiles.get(self.active_profile))
+        return [display for _, display in rows]
+    
+    def fuzzy_search(self, pattern, max_distance=None, exact_length=False):
+        """
+        Find words within a weighted edit distance of pattern
+        
+        Confusable OCR substitutions (l/1, rn/m, ...) cost less than other edits.
+        
+        Returns:
+            list: (word, distance) pairs ranked by distance, exact matches first
+        """
+        pattern = self.normalize(pattern)
+        if not pattern:
             return []
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyIndex(self.word_list)
+        if max_distance is None:
+            max_distance = self.fuzzy_max_distance
+        return [(self.display_forms.get(word, word), distance)
+                for word, distance in self._fuzzy_index.search(pattern, max_distance, exact_length)]
+    
+    def _filter_letters(self, letters, mode):
+        """Answer anagram and contains-letters queries from the letter-multiset index"""
+        if self._anagram_index is None:
+            self._anagram_index = AnagramIndex(self.word_list)
+        if mode == "anagram":
+            word_ids = self._anagram_index.anagrams(letters)
+        else:
+            word_ids = self._anagram_index.containing(letters)
+        return [self.display_list[i] for i in sorted(word_ids)]
+    
+    def _get_char_matrix(self):
+        """Get the NumPy character matrices, packing them on first use"""
+        if self._char_matrix is None:
+            self._char_matrix = CharMatrixIndex(self.word_list)
+        return self._char_matrix
+    
+    def _get_wordbank(self):
+        """Get the SQLite wordbank, synced with the selected wordlist files"""
+        if self._wordbank is not None and self._wordbank.fold_diacritics != self.fold_diacritics:
+            self._wordbank.close()
+            self._wordbank = None
+        if self._wordbank is None:
+            self._wordbank = SQLiteWordBank(self.wordbank_path, self.fold_diacritics)
+        if self._wordbank_version != self.index_version:
+            self._wordbank.sync(self.wordlists_folder, self.selected_files)
+            self._wordbank_version = self.index_version
+        return self._wordbank
+    
+    def _compile_matcher(self, pattern, exact_length, mode, excluded=None):
+        """Build the regex check every candidate must pass"""
+        # Known characters are literal, _ is a single-character wildcard
+        regex_body = pattern_to_regex(pattern, excluded)
+        if mode == "contains":
+            return re.compile(regex_body, re.IGNORECASE).search
+        if exact_length:
+            return re.compile(f"^{regex_body}$", re.IGNORECASE).match
+        return re.compile(f"^{regex_body}", re.IGNORECASE).match
+    
+    def _matching_ids(self, pattern, exact_length, mode, excluded=None, shared=None):
+        """
+        Get ids of words matching a folded pattern, in word_list order
+        
+        shared carries partial results (index intersections or numpy column masks)
+        between the patterns of one filter_many batch.
+        """
+        if mode == "pattern" and self.engine == "numpy":
+            return self._get_char_matrix().match_ids(pattern, exact_length, excluded, shared)
+
+        matcher = self._compile_matcher(pattern, exact_length, mode, excluded)
+        candidates = self.planner.execute(self.planner.plan(pattern, exact_length, mode), shared)
+        if candidates is None:
+            return [i for i, word in enumerate(self.word_list) if matcher(word)]
+        # Check index candidates against the full pattern
+        return [i for i in sorted(candidates) if matcher(self.word_list[i])]
+    
+    def ids_with_min_length(self, length):
+        """Get ids of words at least length characters long (cached per length)"""
+        if length not in self._min_length_ids:
+            self._min_length_ids[length] = set().union(
+                *(bucket for size, bucket in self.length_buckets.items() if size >= length))
+        return self._min_length_ids[length]
     
     def load_word_list(self, file_path):
         """Load words from a file"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self.word_list = [line.strip() for line in f if line.strip()]
+            self._build_indexes()
         except FileNotFoundError:
             print(f"Warning: Word list file {file_path} not found, using default words")
     
@@ -154,24 +679,33 @@ class WordFilter:
         if isinstance(words, str):
             words = [words]
         self.word_list.extend(words)
+        self._build_indexes()
         
     def get_word_count(self):
         """Get total number of words in the list"""
+        if self.mapped_wordbank is not None:
+            return len(self.mapped_wordbank)
+        if self.engine == "sqlite":
+            return self._get_wordbank().size(self.selected_files, self.profiles.get(self.active_profile))
         return len(self.word_list)
     
     def update_selected_wordlists(self, selected_files):
         """Update which wordlists are selected and reload"""
         self.selected_files = selected_files
-        self._save_selected_files()
+        if self.active_profile is None:
+            self._save_selected_files()
+        else:
+            self.profiles[self.active_profile].wordlists = list(selected_files)
+            save_profiles(self.settings_file, self.profiles, self.active_profile)
         self._load_all_wordlists()
     
     def add_user_word(self, word):
         """Add a word to the user's custom wordlist"""
-        word = word.strip().lower()
+        word = display_form(word)
         if not word:
             return False
             
-        if word in self.word_set:
+        if self._has_word(self.normalize(word)):
             return False  # Word already exists
             
         # Add to user words file
@@ -180,8 +714,13 @@ class WordFilter:
                 f.write(word + '\n')
             
             # Update in-memory sets
-            self.word_set.add(word)
+            self._forget_profiles_using(os.path.basename(self.user_words_file))
+            if self.engine == "sqlite":
+                self._build_indexes()  # new version: the wordbank resyncs the file
+                return True
+            self._add_to_index(word)
             self.word_list = sorted(list(self.word_set))
+            self._build_indexes()
             return True
             
         except Exception as e:
@@ -190,27 +729,30 @@ class WordFilter:
     
     def remove_user_word(self, word):
         """Remove a word from the user's custom wordlist"""
-        word = word.strip().lower()
-        if not word or word not in self.word_set:
+        key = self.normalize(word.strip())
+        if not key or not self._has_word(key):
             return False
             
         try:
-            # Read all user words
-            user_words = set()
+            # Read all user words, keyed by their folded form
+            user_words = {}
             if os.path.exists(self.user_words_file):
                 with open(self.user_words_file, 'r', encoding='utf-8') as f:
-                    user_words = {line.strip().lower() for line in f if line.strip()}
+                    for line in f:
+                        if line.strip():
+                            user_words.setdefault(self.normalize(line.strip()), display_form(line))
             
             # Remove the word if it exists in user words
-            if word in user_words:
-                user_words.discard(word)
+            if key in user_words:
+                del user_words[key]
                 
                 # Rewrite the file without the word
                 with open(self.user_words_file, 'w', encoding='utf-8') as f:
-                    for w in sorted(user_words):
+                    for w in sorted(user_words.values(), key=self.normalize):
                         f.write(w + '\n')
                 
                 # Reload all wordlists to update in-memory data
+                self._forget_profiles_using(os.path.basename(self.user_words_file))
                 self._load_all_wordlists()
                 return True
             
@@ -220,10 +762,17 @@ class WordFilter:
             print(f"Error removing word: {e}")
             return False
     
+    def _has_word(self, key):
+        """Check whether a folded key is in the active word list"""
+        if self.engine == "sqlite":
+            return self._get_wordbank().count(key, self.selected_files, exact_length=True) > 0
+        return key in self.word_set
+    
     def get_combined_wordlist(self):
         """Get all words from selected wordlists, sorted alphabetically then by length"""
         # Sort by length first, then alphabetically
-        return sorted(self.word_list, key=lambda x: (len(x), x))
+        order = sorted(range(len(self.word_list)), key=lambda i: (len(self.word_list[i]), self.word_list[i]))
+        return [self.display_list[i] for i in order]
     
     def get_available_wordlists(self):
         """Get list of available wordlist filenames"""
@@ -0,0 +1,67 @@
+"""
+Compact binary word-frequency table used for "by likelihood" ranking
+
+tools/build_frequency_table.py builds it from a corpus count list. Until one
+is imported, the bundled table only scores how many game wordlists share a
+word (a placeholder with a few coarse tiers).
+
+File layout (zlib-compressed after the 4-byte magic):
+    uint32 count (little endian)
+    count x uint8 scores (0 = unknown/rare, 255 = most common)
+    UTF-8 keys joined by newlines, in the same order as the scores
+"""
+import math
+import os
+import struct
+import zlib
+
+from .normalization import fold
+
+FREQUENCY_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "data", "word_frequencies.bin")
+_MAGIC = b'PFQ1'
+
+
+def quantize_counts(counts):
+    """Map raw occurrence counts onto 0-255 scores on a log scale"""
+    top = max(counts.values(), default=0)
+    if top <= 0:
+        return {key: 0 for key in counts}
+    scale = math.log1p(top)
+    return {key: int(round(255 * math.log1p(max(count, 0)) / scale)) for key, count in counts.items()}
+
+
+def write_frequency_table(path, scores):
+    """Write {word: 0-255 score} to path in the binary table format"""
+    keys = sorted(fold(word) for word in scores)
+    folded = {fold(word): score for word, score in scores.items()}
+    payload = struct.pack('<I', len(keys))
+    payload += bytes(min(255, max(0, int(folded[key]))) for key in keys)
+    payload += '\n'.join(keys).encode('utf-8')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_MAGIC + zlib.compress(payload, 9))
+
+
+def load_frequency_table(path=FREQUENCY_TABLE_PATH):
+    """
+    Load a frequency table
+
+    Returns:
+        dict: Folded word -> 0-255 score (empty if the table is missing or invalid)
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != _MAGIC:
+            raise ValueError("not a word frequency table")
+        payload = zlib.decompress(data[4:])
+        (count,) = struct.unpack_from('<I', payload)
+        scores = payload[4:4 + count]
+        keys = payload[4 + count:].decode('utf-8').split('\n') if count else []
+        return dict(zip(keys, scores))
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading word frequency table {path}: {e}")
+        return {}
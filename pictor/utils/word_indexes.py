@@ -0,0 +1,70 @@
+"""
+Positional and affix indexes over the active word list
+"""
+import bisect
+
+
+class PositionalIndex:
+    """Maps (position, character) to the ids of words with that character at that position"""
+
+    def __init__(self, words=None):
+        self.postings = {}
+        if words:
+            self.build(words)
+
+    def build(self, words):
+        """Rebuild postings for a list of words (word id = position in the list)"""
+        self.postings = {}
+        for word_id, word in enumerate(words):
+            for position, char in enumerate(word):
+                self.postings.setdefault((position, char), set()).add(word_id)
+
+    def lookup(self, position, char):
+        """Get ids of words with char at position"""
+        return self.postings.get((position, char), set())
+
+    def posting_size(self, position, char):
+        """Get the number of words with char at position"""
+        return len(self.postings.get((position, char), ()))
+
+
+class AffixIndex:
+    """
+    Sorted key array answering prefix lookups by binary search
+
+    With from_end=True the keys are the reversed words, so the same lookup
+    answers suffix queries.
+    """
+
+    def __init__(self, words=None, from_end=False):
+        self.from_end = from_end
+        self.keys = []
+        self.ids = []
+        if words:
+            self.build(words)
+
+    def build(self, words):
+        """Rebuild the sorted key array for a list of words"""
+        entries = sorted(
+            (word[::-1] if self.from_end else word, word_id)
+            for word_id, word in enumerate(words)
+        )
+        self.keys = [key for key, _ in entries]
+        self.ids = [word_id for _, word_id in entries]
+
+    def _range(self, affix):
+        """Get the [lo, hi) slice of keys starting with affix"""
+        key = affix[::-1] if self.from_end else affix
+        lo = bisect.bisect_left(self.keys, key)
+        hi = bisect.bisect_left(self.keys, key + '\U0010ffff', lo)
+        return lo, hi
+
+    def count(self, affix):
+        """Get the number of words starting (or ending) with affix"""
+        lo, hi = self._range(affix)
+        return hi - lo
+
+    def lookup(self, affix):
+        """Get ids of words starting (or ending) with affix"""
+        lo, hi = self._range(affix)
+        return set(self.ids[lo:hi])
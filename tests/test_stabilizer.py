@@ -0,0 +1,44 @@
+import unittest
+
+from pictor.capture.stabilizer import ReadingStabilizer
+
+
+class ReadingStabilizerTest(unittest.TestCase):
+
+    def test_reveals_are_reported_as_they_arrive(self):
+        stabilizer = ReadingStabilizer(window=5)
+        for pattern in ["_____", "a____", "a_p__", "a_p_e", "apple", "_______ ____"]:
+            self.assertEqual(stabilizer.add(pattern, 0.8), pattern)
+
+    def test_low_confidence_misread_is_not_accepted(self):
+        stabilizer = ReadingStabilizer(window=5)
+        for _ in range(3):
+            stabilizer.add("a____")
+        stabilizer.add("a_b__", 0.2)
+        self.assertEqual(stabilizer.voted, "a____")
+        for _ in range(20):
+            stabilizer.add("a____")
+            self.assertEqual(stabilizer.voted, "a____")
+
+    def test_blanks_overturn_an_accepted_letter(self):
+        stabilizer = ReadingStabilizer(window=5)
+        for _ in range(3):
+            stabilizer.add("a____")
+        self.assertEqual(stabilizer.add("a_b__", 0.6), "a_b__")
+        self.assertEqual(stabilizer.add("a____"), "a____")
+
+    def test_blanks_read_before_a_reveal_do_not_hold_it_back(self):
+        stabilizer = ReadingStabilizer(window=5)
+        for _ in range(4):
+            stabilizer.add("_____")
+        self.assertEqual(stabilizer.add("__p__", 0.8), "__p__")
+
+    def test_new_layout_starts_over(self):
+        stabilizer = ReadingStabilizer(window=5)
+        stabilizer.add("apple")
+        self.assertEqual(stabilizer.add("___ __"), "___ __")
+        self.assertEqual(list(stabilizer.readings), [("___ __", 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Build pictor/data/word_frequencies.bin
+
+With --counts, scores come from a corpus frequency list: "word<TAB>count"
+lines, or "word count" lines as in most published unigram lists. This is how
+the shipped table is meant to be built.
+
+Without it, each word is scored by how many bundled game wordlists contain
+it. That gives only a few distinct scores (one per number of lists), so it
+is a placeholder: within a tier, words keep their length/alphabetical order.
+The word_frequencies.bin currently in the repo is this placeholder.
+
+    python tools/build_frequency_table.py --counts frequencies.tsv
+    python tools/build_frequency_table.py              # placeholder from list overlap
+"""
+import argparse
+import os
+import sys
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.normalization import fold  # noqa: E402
+from pictor.utils.word_frequency import FREQUENCY_TABLE_PATH, quantize_counts, write_frequency_table  # noqa: E402
+
+WORDLISTS_FOLDER = os.path.join(project_root, "pictor", "wordlists")
+# The editable user list mirrors other lists and is not evidence of frequency
+SKIPPED_LISTS = {"user_added_words.txt"}
+
+
+def counts_from_tsv(path):
+    """Read word<TAB>count lines (or "word count", split on the last run of whitespace)"""
+    counts = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            parts = line.split("\t") if "\t" in line else line.rsplit(None, 1)
+            if len(parts) >= 2 and parts[0].strip():
+                try:
+                    key = fold(parts[0].strip())
+                    counts[key] = counts.get(key, 0) + float(parts[1])
+                except ValueError:
+                    continue
+    return counts
+
+
+def counts_from_wordlists(folder):
+    """Count how many bundled game wordlists contain each word"""
+    counts = {}
+    for filename in sorted(os.listdir(folder)):
+        if not filename.endswith(".txt") or filename in SKIPPED_LISTS:
+            continue
+        with open(os.path.join(folder, filename), encoding="utf-8") as f:
+            for key in {fold(line.strip()) for line in f if line.strip()}:
+                counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", help="word<TAB>count file to score from")
+    parser.add_argument("--output", default=FREQUENCY_TABLE_PATH)
+    args = parser.parse_args()
+
+    if args.counts:
+        counts = counts_from_tsv(args.counts)
+    else:
+        print("No --counts file: writing the placeholder table scored by wordlist overlap")
+        counts = counts_from_wordlists(WORDLISTS_FOLDER)
+    write_frequency_table(args.output, quantize_counts(counts))
+    print(f"Wrote {len(counts)} scores to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
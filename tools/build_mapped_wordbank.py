@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Build a memory-mapped wordbank file from wordlist files
+
+Load it with WordFilter(mapped_wordbank=path). Without input files, every
+bundled wordlist is included.
+
+    python tools/build_mapped_wordbank.py
+    python tools/build_mapped_wordbank.py huge_list.txt --output huge.pwb
+"""
+import argparse
+import os
+import sys
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pictor.utils.mapped_wordbank import write_mapped_wordbank  # noqa: E402
+
+WORDLISTS_FOLDER = os.path.join(project_root, "pictor", "wordlists")
+
+
+def read_words(paths):
+    """Yield the lines of every input file"""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            yield from f
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="wordlist files (default: the bundled wordlists)")
+    parser.add_argument("--output", default=os.path.join(project_root, "pictor", "data", "wordbank.pwb"))
+    parser.add_argument("--keep-diacritics", action="store_true", help="do not fold accented letters")
+    args = parser.parse_args()
+
+    files = args.files or [os.path.join(WORDLISTS_FOLDER, name)
+                           for name in sorted(os.listdir(WORDLISTS_FOLDER)) if name.endswith(".txt")]
+    count = write_mapped_wordbank(args.output, read_words(files), fold_diacritics=not args.keep_diacritics)
+    print(f"Wrote {count} words to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()